@@ -1,12 +1,27 @@
 import os
+import time
+import shutil
 import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, File, UploadFile, Form, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, StreamingResponse
+from functools import wraps
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+from fastapi import (
+    APIRouter,
+    File,
+    UploadFile,
+    Form,
+    HTTPException,
+    Request,
+)
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import ValidationError
-import io
+import aiofiles
+import orjson
+from decouple import config
 
 from ..models.schemas import (
     DubbingRequest,
@@ -25,12 +40,16 @@ from ..services.translate import translation_service
 from ..services.tts import tts_service
 from ..services.voice_clone import voice_clone_service, synthesize_with_cloned_voice
 from ..utils.helpers import (
+    FastPath,
+    JobManager,
     file_manager,
     job_manager,
     ValidationUtils,
     ErrorHandler,
     format_duration,
+    generate_file_hash,
 )
+from ..utils.memo import AsyncMemoizer
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +59,302 @@ router = APIRouter(prefix="/api/v1", tags=["dubbing"])
 # Maximum file size (200MB)
 MAX_FILE_SIZE = 200 * 1024 * 1024
 
+# Maximum request body size: an input file and a reference audio, plus form fields
+MAX_REQUEST_SIZE = 2 * MAX_FILE_SIZE + (1 << 20)
+
+# Chunk size used when streaming uploads to disk (1MB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Number of dubbing workers, and so of jobs processed at the same time
+DUBBING_CONCURRENCY = config("DUBBING_CONCURRENCY", default=2, cast=int)
+
+# Seconds a serialized health check response is reused
+HEALTH_CACHE_TTL = 5.0
+_health_cache = {"expires_at": 0.0, "body": b""}
+
+# Number of built job results kept for repeated polls
+JOB_RESULT_CACHE_SIZE = 128
+_job_result_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+# Chunk size used when streaming synthesized audio (64KB)
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+# Bounds of the synthesized audio caches
+AUDIO_CACHE_SIZE = config("AUDIO_CACHE_SIZE", default=256, cast=int)
+AUDIO_CACHE_MAX_BYTES = config(
+    "AUDIO_CACHE_MAX_BYTES", default=256 * 1024 * 1024, cast=int
+)
+
+
+# The in-memory job store only touches a dict, but the Redis one makes network
+# round trips that must not run on the event loop
+_JOB_STORE_BLOCKING = not isinstance(job_manager, JobManager)
+
+
+async def _job_store(fn: Callable, *args, **kwargs):
+    """Call a job_manager method, in a worker thread if it does network I/O"""
+    if _JOB_STORE_BLOCKING:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
+
+
+def api_route(fn: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+    """Turn unexpected errors raised by a route into 500 responses"""
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error in {fn.__name__}: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return wrapper
+
+
+# Accepted upload extensions, mapped to the suffix used for the temporary file
+_ALLOWED_SUFFIX = MappingProxyType(
+    {
+        fmt.lstrip("."): fmt
+        for fmt in audio_extraction_service.supported_video_formats
+        + audio_extraction_service.supported_audio_formats
+    }
+)
+
+
+def _safe_suffix(filename: Optional[str]) -> str:
+    """
+    Get the temporary file suffix for an uploaded file name
+
+    Args:
+        filename: Name of the uploaded file
+
+    Returns:
+        Canonical suffix for the file's format
+    """
+    ext = os.path.splitext(filename or "")[1].lstrip(".").lower()
+    suffix = _ALLOWED_SUFFIX.get(ext)
+    if suffix is None:
+        raise HTTPException(status_code=415, detail="Unsupported file format")
+    return suffix
+
+
+def _file_too_large() -> HTTPException:
+    """Build the 413 error raised for oversized uploads"""
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024*1024):.0f}MB",
+    )
+
+
+async def _spool_upload(upload: UploadFile, suffix: str) -> str:
+    """
+    Stream an uploaded file to a temporary file on disk
+
+    Args:
+        upload: Uploaded file
+        suffix: Suffix for the temporary file
+
+    Returns:
+        Path to the temporary file
+    """
+    # Reject early when the client announces an oversized upload
+    if upload.size is not None and upload.size > MAX_FILE_SIZE:
+        raise _file_too_large()
+
+    path = file_manager.create_temp_file(suffix=suffix)
+
+    try:
+        total = 0
+        async with aiofiles.open(path, "wb") as out:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                # Enforce the limit on bytes actually received
+                total += len(chunk)
+                if total > MAX_FILE_SIZE:
+                    raise _file_too_large()
+                await out.write(chunk)
+    except BaseException:
+        file_manager.cleanup_file(path)
+        raise
+
+    return path
+
+
+async def _spool_request_body(
+    http_request: Request,
+    input_path: str,
+    reference_path: Optional[str] = None,
+    reference_size: int = 0,
+) -> None:
+    """
+    Stream a raw request body to disk
+
+    Args:
+        http_request: Incoming request
+        input_path: Path receiving the input file
+        reference_path: Path receiving the reference audio
+        reference_size: Number of leading body bytes that hold the reference audio
+    """
+    total = 0
+    remaining = reference_size if reference_path else 0
+    reference_out = await aiofiles.open(reference_path, "wb") if remaining else None
+
+    try:
+        async with aiofiles.open(input_path, "wb") as out:
+            async for chunk in http_request.stream():
+                total += len(chunk)
+                if total > MAX_FILE_SIZE:
+                    raise _file_too_large()
+
+                # Leading bytes belong to the reference audio
+                if remaining:
+                    head = chunk[:remaining]
+                    await reference_out.write(head)
+                    remaining -= len(head)
+                    chunk = chunk[len(head) :]
+
+                if chunk:
+                    await out.write(chunk)
+    finally:
+        if reference_out is not None:
+            await reference_out.close()
+
+    if remaining:
+        raise HTTPException(
+            status_code=400, detail="Request body shorter than reference_size"
+        )
+
+
+async def _queue_job(
+    http_request: Request,
+    input_path: str,
+    reference_path: Optional[str],
+    request: DubbingRequest,
+) -> str:
+    """
+    Create a dubbing job and queue it for the dubbing workers
+
+    Args:
+        http_request: Incoming request
+        input_path: Spooled input file
+        reference_path: Spooled reference audio, if any
+        request: Dubbing parameters
+
+    Returns:
+        ID of the new job
+
+    Raises:
+        HTTPException: 503 if the job queue is full
+    """
+    job_id = await _job_store(job_manager.create_job, "dubbing")
+    try:
+        http_request.app.state.job_queue.put_nowait(
+            (job_id, input_path, reference_path, request)
+        )
+    except asyncio.QueueFull:
+        await _job_store(job_manager.delete_job, job_id)
+        raise HTTPException(
+            status_code=503, detail="Too many dubbing jobs queued, try again later"
+        )
+    return job_id
+
+
+async def _synthesize_speech(
+    text: str,
+    voice_name: str,
+    speaking_rate: float,
+    pitch: float,
+    volume_gain_db: float,
+    language: str,
+) -> bytes:
+    """Synthesize speech and return the WAV bytes"""
+    output_path = file_manager.create_temp_file(suffix=".wav")
+
+    try:
+        result = await asyncio.to_thread(
+            tts_service.synthesize_speech,
+            text=text,
+            output_path=output_path,
+            voice=voice_name,
+            speaking_rate=speaking_rate,
+            pitch=pitch,
+            volume_gain_db=volume_gain_db,
+            language=language,
+        )
+
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+
+        async with aiofiles.open(output_path, "rb") as f:
+            return await f.read()
+
+    finally:
+        file_manager.cleanup_file(output_path)
+
+
+async def _clone_voice(
+    text: str,
+    reference_path: str,
+    target_language: str,
+    speed: float,
+    reference_hash: str,
+):
+    """
+    Clone voice from a reference audio file
+
+    The call owns reference_path and removes it when done, since the
+    memoized task can outlive the request that spooled the file.
+    """
+    try:
+        return await asyncio.to_thread(
+            voice_clone_service.clone_voice,
+            text,
+            reference_path,
+            target_language,
+            speed=speed,
+        )
+    finally:
+        file_manager.cleanup_file(reference_path)
+
+
+async def _iter_audio(audio_data: bytes) -> AsyncIterator[bytes]:
+    """Yield rendered audio in fixed-size chunks"""
+    for offset in range(0, len(audio_data), AUDIO_CHUNK_SIZE):
+        yield audio_data[offset : offset + AUDIO_CHUNK_SIZE]
+
+
+# Share identical synthesis requests, including ones still in flight
+_synthesize_speech_cached = AsyncMemoizer(
+    _synthesize_speech,
+    maxsize=AUDIO_CACHE_SIZE,
+    sizeof=len,
+    max_bytes=AUDIO_CACHE_MAX_BYTES,
+)
+_clone_voice_cached = AsyncMemoizer(
+    _clone_voice,
+    maxsize=AUDIO_CACHE_SIZE,
+    # Key on the reference audio contents rather than its temporary path
+    key=lambda text, reference_path, target_language, speed, reference_hash: (
+        text,
+        reference_hash,
+        target_language,
+        speed,
+    ),
+    sizeof=lambda result: len(result.cloned_audio_data),
+    max_bytes=AUDIO_CACHE_MAX_BYTES,
+)
+
 
 @router.get("/health", response_model=HealthCheck)
+@api_route
 async def health_check():
     """Health check endpoint"""
-    try:
+    now = time.monotonic()
+
+    # Rebuild the serialized response at most once per HEALTH_CACHE_TTL
+    if now >= _health_cache["expires_at"]:
         services_status = {
             "audio_extraction": True,
             "whisper_transcription": whisper_service.model is not None,
@@ -53,20 +363,23 @@ async def health_check():
             "voice_cloning": voice_clone_service.tts_model is not None,
         }
 
-        return HealthCheck(
-            status="healthy",
-            version="1.0.0",
-            timestamp=datetime.now().isoformat(),
-            services=services_status,
+        _health_cache["body"] = orjson.dumps(
+            {
+                "status": "healthy",
+                "version": "1.0.0",
+                "timestamp": datetime.now().isoformat(),
+                "services": services_status,
+            }
         )
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        raise HTTPException(status_code=500, detail="Health check failed")
+        _health_cache["expires_at"] = now + HEALTH_CACHE_TTL
+
+    return Response(content=_health_cache["body"], media_type="application/json")
 
 
 @router.post("/dub", response_model=DubbingResult)
+@api_route
 async def create_dubbing_job(
-    background_tasks: BackgroundTasks,
+    http_request: Request,
     file: UploadFile = File(...),
     source_language: str = Form("auto"),
     target_language: str = Form("en"),
@@ -96,37 +409,20 @@ async def create_dubbing_job(
     Returns:
         DubbingResult with job information
     """
-    try:
-        # Validate file size
-        if file.size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024*1024):.0f}MB",
-            )
-
-        # Create job
-        job_id = job_manager.create_job("dubbing")
+    input_path = None
+    reference_path = None
 
+    try:
         # Save uploaded file
-        input_path = file_manager.create_temp_file(
-            suffix=f".{file.filename.split('.')[-1]}"
-        )
-
-        with open(input_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        input_path = await _spool_upload(file, suffix=_safe_suffix(file.filename))
 
         # Save reference audio if provided
-        reference_path = None
         if use_voice_cloning and reference_audio:
-            reference_path = file_manager.create_temp_file(
-                suffix=f".{reference_audio.filename.split('.')[-1]}"
+            reference_path = await _spool_upload(
+                reference_audio,
+                suffix=_safe_suffix(reference_audio.filename),
             )
 
-            with open(reference_path, "wb") as buffer:
-                ref_content = await reference_audio.read()
-                buffer.write(ref_content)
-
         # Create request object
         request = DubbingRequest(
             source_language=source_language,
@@ -139,10 +435,8 @@ async def create_dubbing_job(
             preserve_original_timing=preserve_original_timing,
         )
 
-        # Start background processing
-        background_tasks.add_task(
-            process_dubbing_job, job_id, input_path, reference_path, request
-        )
+        # Create the job and queue it for background processing
+        job_id = await _queue_job(http_request, input_path, reference_path, request)
 
         # Return initial result
         return DubbingResult(
@@ -150,69 +444,181 @@ async def create_dubbing_job(
             status=ProcessingStatus.PENDING,
         )
 
-    except HTTPException:
+    except Exception:
+        # Clean up files spooled before the failure
+        if input_path:
+            file_manager.cleanup_file(input_path)
+        if reference_path:
+            file_manager.cleanup_file(reference_path)
         raise
-    except Exception as e:
-        logger.error(f"Error creating dubbing job: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/jobs/{job_id}", response_model=JobStatus)
-async def get_job_status(job_id: str):
-    """Get job status"""
+@router.post("/dub-stream", response_model=DubbingResult)
+@api_route
+async def create_dubbing_job_stream(http_request: Request):
+    """
+    Create a new dubbing job from a raw (non-multipart) request body
+
+    The body is the input video/audio file, optionally preceded by the
+    reference audio for voice cloning. Parameters are read from the query
+    string:
+
+        filename: Name of the input file (used for its extension)
+        reference_size: Length in bytes of the reference audio at the start
+            of the body (0 if no reference audio is sent)
+        reference_filename: Name of the reference audio file
+        source_language, target_language, tts_voice, speaking_rate, pitch,
+        volume_gain_db, use_voice_cloning, preserve_original_timing:
+            Same as for /dub
+
+    Returns:
+        DubbingResult with job information
+    """
+    params = http_request.query_params
+    input_path = None
+    reference_path = None
+
     try:
-        job = job_manager.get_job(job_id)
+        # Parse parameters
+        try:
+            request = DubbingRequest(
+                **{
+                    field: params[field]
+                    for field in DubbingRequest.model_fields
+                    if field in params
+                }
+            )
+            reference_size = int(params.get("reference_size", 0))
+        except (ValidationError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+        filename = params.get("filename", "input.mp4")
+        input_path = file_manager.create_temp_file(suffix=_safe_suffix(filename))
+
+        if reference_size > 0:
+            reference_filename = params.get("reference_filename", "reference.wav")
+            reference_path = file_manager.create_temp_file(
+                suffix=_safe_suffix(reference_filename)
+            )
+
+        # Save request body
+        await _spool_request_body(
+            http_request, input_path, reference_path, reference_size
+        )
+
+        # Reference audio is only needed for voice cloning
+        if reference_path and not request.use_voice_cloning:
+            file_manager.cleanup_file(reference_path)
+            reference_path = None
 
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
+        # Create the job and queue it for background processing
+        job_id = await _queue_job(http_request, input_path, reference_path, request)
 
-        return JobStatus(
+        # Return initial result
+        return DubbingResult(
             job_id=job_id,
-            status=job["status"],
-            progress=job.get("progress", 0.0),
-            current_step=job.get("current_step", "unknown"),
-            estimated_completion=job.get("estimated_completion"),
-            error_message=job.get("error_message"),
+            status=ProcessingStatus.PENDING,
         )
 
-    except HTTPException:
+    except Exception:
+        # Clean up partially written files
+        if input_path:
+            file_manager.cleanup_file(input_path)
+        if reference_path:
+            file_manager.cleanup_file(reference_path)
         raise
-    except Exception as e:
-        logger.error(f"Error getting job status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _job_etag(job: dict) -> str:
+    """Build a weak ETag that changes with the job status and progress"""
+    status = ProcessingStatus(job["status"]).value
+    return f'W/"{status}-{int(job.get("progress", 0.0) * 10)}"'
+
+
+def _etag_matches(http_request: Request, etag: str) -> bool:
+    """Check whether the client already holds the given ETag"""
+    if_none_match = http_request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _build_job_result(job_id: str, job: dict) -> bytes:
+    """Build the serialized result for a job, reusing it until the job changes"""
+    key = (job_id, job["updated_at"])
+    result = _job_result_cache.get(key)
+
+    if result is not None:
+        _job_result_cache.move_to_end(key)
+        return result
+
+    result = DubbingResult(
+        job_id=job_id,
+        status=job["status"],
+        transcription=job.get("transcription"),
+        translation=job.get("translation"),
+        tts_audio_url=job.get("tts_audio_url"),
+        final_video_url=job.get("final_video_url"),
+        processing_time=job.get("processing_time"),
+        error_message=job.get("error_message"),
+    ).model_dump_json()
+
+    _job_result_cache[key] = result
+    if len(_job_result_cache) > JOB_RESULT_CACHE_SIZE:
+        _job_result_cache.popitem(last=False)
+    return result
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatus)
+@api_route
+async def get_job_status(job_id: str, http_request: Request, response: Response):
+    """Get job status"""
+    job = await _job_store(job_manager.get_job, job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Let pollers skip unchanged states
+    etag = _job_etag(job)
+    if _etag_matches(http_request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    return JobStatus(
+        job_id=job_id,
+        status=job["status"],
+        progress=job.get("progress", 0.0),
+        current_step=job.get("current_step", "unknown"),
+        estimated_completion=job.get("estimated_completion"),
+        error_message=job.get("error_message"),
+    )
 
 
 @router.get("/jobs/{job_id}/result", response_model=DubbingResult)
-async def get_job_result(job_id: str):
+@api_route
+async def get_job_result(job_id: str, http_request: Request):
     """Get job result"""
-    try:
-        job = job_manager.get_job(job_id)
+    job = await _job_store(job_manager.get_job, job_id)
 
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-        if job["status"] not in ["completed", "failed"]:
-            raise HTTPException(status_code=202, detail="Job not completed yet")
+    if job["status"] not in ["completed", "failed"]:
+        raise HTTPException(status_code=202, detail="Job not completed yet")
 
-        return DubbingResult(
-            job_id=job_id,
-            status=job["status"],
-            transcription=job.get("transcription"),
-            translation=job.get("translation"),
-            tts_audio_url=job.get("tts_audio_url"),
-            final_video_url=job.get("final_video_url"),
-            processing_time=job.get("processing_time"),
-            error_message=job.get("error_message"),
-        )
+    etag = _job_etag(job)
+    if _etag_matches(http_request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting job result: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return Response(
+        content=_build_job_result(job_id, job),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.post("/transcribe", response_model=TranscriptionResult)
+@api_route
 async def transcribe_audio(
     file: UploadFile = File(...),
     language: str = Form("auto"),
@@ -229,59 +635,50 @@ async def transcribe_audio(
     Returns:
         TranscriptionResult with transcription segments
     """
-    try:
-        # Validate file size
-        if file.size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024*1024):.0f}MB",
-            )
-
-        # Save uploaded file
-        input_path = file_manager.create_temp_file(
-            suffix=f".{file.filename.split('.')[-1]}"
-        )
-
-        with open(input_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+    # Save uploaded file
+    input_path = await _spool_upload(file, suffix=_safe_suffix(file.filename))
 
-        try:
-            # Extract audio if video file
+    try:
+        validation_result = None
+        if file_manager.quick_probe(input_path) != FastPath.WHISPER_READY:
             validation_result = audio_extraction_service.validate_file(input_path)
 
-            if validation_result["valid"] and validation_result["type"] == "video":
-                # Extract audio
-                extraction_result = audio_extraction_service.extract_audio_from_video(
+        # Extract audio if video file
+        if (
+            validation_result
+            and validation_result["valid"]
+            and validation_result["type"] == "video"
+        ):
+            # Extract audio
+            extraction_result = (
+                await audio_extraction_service.extract_audio_from_video_async(
                     input_path
                 )
-                audio_path = extraction_result.audio_file_path
-            else:
-                audio_path = input_path
-
-            # Transcribe audio
-            result = whisper_service.transcribe_audio(
-                audio_path,
-                language=language if language != "auto" else None,
-                model_size=model_size,
             )
+            audio_path = extraction_result.audio_file_path
+        else:
+            audio_path = input_path
 
-            return result
+        # Transcribe audio
+        result: TranscriptionResult = await asyncio.to_thread(
+            whisper_service.transcribe_audio,
+            audio_path,
+            language=language if language != "auto" else None,
+            model_size=model_size,
+        )
 
-        finally:
-            # Clean up files
-            file_manager.cleanup_file(input_path)
-            if "audio_path" in locals() and audio_path != input_path:
-                file_manager.cleanup_file(audio_path)
+        # Serialize once instead of letting FastAPI revalidate the segments
+        return Response(content=result.model_dump_json(), media_type="application/json")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error transcribing audio: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Clean up files
+        file_manager.cleanup_file(input_path)
+        if "audio_path" in locals() and audio_path != input_path:
+            file_manager.cleanup_file(audio_path)
 
 
 @router.post("/translate")
+@api_route
 async def translate_text(
     text: str = Form(...),
     source_language: str = Form("auto"),
@@ -298,19 +695,15 @@ async def translate_text(
     Returns:
         Translation result
     """
-    try:
-        result = translation_service.translate_text(
-            text, source_language, target_language
-        )
-
-        return result
+    result = await translation_service.atranslate_text(
+        text, source_language, target_language
+    )
 
-    except Exception as e:
-        logger.error(f"Error translating text: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return result
 
 
 @router.post("/tts")
+@api_route
 async def text_to_speech(
     text: str = Form(...),
     voice_name: str = Form("en-US-Wavenet-D"),
@@ -333,25 +726,27 @@ async def text_to_speech(
     Returns:
         Audio file response
     """
-    try:
-        # Generate speech
-        result = tts_service.synthesize_speech(
-            text, voice_name, language_code, speaking_rate, pitch, volume_gain_db
-        )
+    # XTTS language: codes it knows are kept ("zh-cn"), others lose their
+    # region ("en-US" -> "en")
+    language = language_code.lower()
+    if language not in tts_service.get_supported_languages():
+        language = language.split("-")[0]
 
-        # Return audio as streaming response
-        return StreamingResponse(
-            io.BytesIO(result.audio_data),
-            media_type="audio/wav",
-            headers={"Content-Disposition": "attachment; filename=speech.wav"},
-        )
+    # Generate speech
+    audio_data = await _synthesize_speech_cached(
+        text, voice_name, speaking_rate, pitch, volume_gain_db, language
+    )
 
-    except Exception as e:
-        logger.error(f"Error generating speech: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Return audio as streaming response
+    return StreamingResponse(
+        _iter_audio(audio_data),
+        media_type="audio/wav",
+        headers={"Content-Disposition": "attachment; filename=speech.wav"},
+    )
 
 
 @router.post("/voice-clone")
+@api_route
 async def clone_voice(
     text: str = Form(...),
     reference_audio: UploadFile = File(...),
@@ -370,93 +765,123 @@ async def clone_voice(
     Returns:
         Audio file response
     """
-    try:
-        # Save reference audio
-        reference_path = file_manager.create_temp_file(
-            suffix=f".{reference_audio.filename.split('.')[-1]}"
-        )
+    # Save reference audio
+    reference_path = await _spool_upload(
+        reference_audio, suffix=_safe_suffix(reference_audio.filename)
+    )
 
-        with open(reference_path, "wb") as buffer:
-            content = await reference_audio.read()
-            buffer.write(content)
+    # The reference file is handed to the clone task if this request starts
+    # one; a request sharing an existing task keeps and removes its own copy
+    owns_reference = True
 
-        try:
-            # Clone voice
-            result = voice_clone_service.clone_voice(
-                text, reference_path, target_language, speed=speed
-            )
+    try:
+        # Clone voice
+        reference_hash = await asyncio.to_thread(generate_file_hash, reference_path)
+        args = (text, reference_path, target_language, speed, reference_hash)
+        owns_reference = _clone_voice_cached.is_cached(*args)
+        result = await _clone_voice_cached(*args)
 
-            # Return audio as streaming response
-            return StreamingResponse(
-                io.BytesIO(result.cloned_audio_data),
-                media_type="audio/wav",
-                headers={
-                    "Content-Disposition": "attachment; filename=cloned_voice.wav"
-                },
-            )
+        # Return audio as streaming response
+        return StreamingResponse(
+            _iter_audio(result.cloned_audio_data),
+            media_type="audio/wav",
+            headers={"Content-Disposition": "attachment; filename=cloned_voice.wav"},
+        )
 
-        finally:
-            # Clean up reference audio
+    finally:
+        # Clean up reference audio not handed to a clone task
+        if owns_reference:
             file_manager.cleanup_file(reference_path)
 
-    except Exception as e:
-        logger.error(f"Error cloning voice: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
 
 @router.get("/supported-languages")
+@api_route
 async def get_supported_languages():
     """Get supported languages"""
-    try:
-        return {
-            "whisper": whisper_service.get_supported_languages(),
-            "translation": list(translation_service.get_supported_languages().keys()),
-            "tts": list(tts_service.get_supported_languages().keys()),
-            "voice_cloning": voice_clone_service.get_supported_languages(),
-        }
-
-    except Exception as e:
-        logger.error(f"Error getting supported languages: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "whisper": whisper_service.get_supported_languages(),
+        "translation": list(translation_service.get_supported_languages().keys()),
+        "tts": list(tts_service.get_supported_languages().keys()),
+        "voice_cloning": voice_clone_service.get_supported_languages(),
+    }
 
 
 @router.get("/supported-voices")
+@api_route
 async def get_supported_voices():
     """Get supported TTS voices"""
-    try:
-        return tts_service.get_supported_voices()
-
-    except Exception as e:
-        logger.error(f"Error getting supported voices: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return tts_service.get_supported_voices()
 
 
 @router.delete("/jobs/{job_id}")
+@api_route
 async def delete_job(job_id: str):
     """Delete a job"""
-    try:
-        success = job_manager.delete_job(job_id)
+    success = await _job_store(job_manager.delete_job, job_id)
 
-        if not success:
-            raise HTTPException(status_code=404, detail="Job not found")
+    if not success:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-        return {"message": "Job deleted successfully"}
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting job: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"message": "Job deleted successfully"}
 
 
 # Background task functions
+async def dubbing_worker(queue: asyncio.Queue) -> None:
+    """Process queued dubbing jobs until cancelled"""
+    while True:
+        job_id, input_path, reference_path, request = await queue.get()
+        try:
+            await process_dubbing_job(job_id, input_path, reference_path, request)
+        except asyncio.CancelledError:
+            await _job_store(
+                job_manager.update_job,
+                job_id,
+                status=ProcessingStatus.FAILED,
+                error_message="Server shut down during processing",
+            )
+            raise
+        finally:
+            queue.task_done()
+
+
+async def fail_queued_jobs(queue: asyncio.Queue) -> int:
+    """
+    Mark jobs still waiting in the queue as failed and remove their files
+
+    Args:
+        queue: Dubbing job queue, with its workers stopped
+
+    Returns:
+        Number of jobs dropped
+    """
+    dropped = 0
+    while not queue.empty():
+        job_id, input_path, reference_path, _ = queue.get_nowait()
+        await _job_store(
+            job_manager.update_job,
+            job_id,
+            status=ProcessingStatus.FAILED,
+            error_message="Server shut down before the job started",
+        )
+        file_manager.cleanup_file(input_path)
+        if reference_path:
+            file_manager.cleanup_file(reference_path)
+        queue.task_done()
+        dropped += 1
+    return dropped
+
+
 async def process_dubbing_job(
     job_id: str, input_path: str, reference_path: Optional[str], request: DubbingRequest
 ):
     """Process dubbing job in background"""
+    # Per-job directory for synthesized segments
+    job_dir = file_manager.base_dir / job_id
+
     try:
         # Update job status
-        job_manager.update_job(
+        await _job_store(
+            job_manager.update_job,
             job_id,
             status=ProcessingStatus.PROCESSING,
             progress=0.0,
@@ -464,22 +889,42 @@ async def process_dubbing_job(
         )
 
         # Step 1: Extract audio
-        job_manager.update_job(job_id, progress=10.0, current_step="Extracting audio")
+        await _job_store(
+            job_manager.update_job,
+            job_id,
+            progress=10.0,
+            current_step="Extracting audio",
+        )
 
-        validation_result = audio_extraction_service.validate_file(input_path)
+        # Input that Whisper can read directly needs no extraction
+        validation_result = None
+        if file_manager.quick_probe(input_path) != FastPath.WHISPER_READY:
+            validation_result = audio_extraction_service.validate_file(input_path)
 
-        if validation_result["valid"] and validation_result["type"] == "video":
-            extraction_result = audio_extraction_service.extract_audio_from_video(
-                input_path
+        if (
+            validation_result
+            and validation_result["valid"]
+            and validation_result["type"] == "video"
+        ):
+            extraction_result = (
+                await audio_extraction_service.extract_audio_from_video_async(
+                    input_path
+                )
             )
             audio_path = extraction_result.audio_file_path
         else:
             audio_path = input_path
 
         # Step 2: Transcribe
-        job_manager.update_job(job_id, progress=30.0, current_step="Transcribing audio")
+        await _job_store(
+            job_manager.update_job,
+            job_id,
+            progress=30.0,
+            current_step="Transcribing audio",
+        )
 
-        transcription = whisper_service.transcribe_audio(
+        transcription = await asyncio.to_thread(
+            whisper_service.transcribe_audio,
             audio_path,
             language=(
                 request.source_language if request.source_language != "auto" else None
@@ -487,46 +932,66 @@ async def process_dubbing_job(
         )
 
         # Step 3: Translate
-        job_manager.update_job(job_id, progress=50.0, current_step="Translating text")
+        await _job_store(
+            job_manager.update_job,
+            job_id,
+            progress=50.0,
+            current_step="Translating text",
+        )
 
-        translations = translation_service.translate_segments(
-            transcription.segments, request.source_language, request.target_language
+        translations = await translation_service.atranslate_segments(
+            transcription.segments,
+            request.source_language,
+            request.target_language,
         )
 
         # Step 4: Generate speech
-        job_manager.update_job(job_id, progress=70.0, current_step="Generating speech")
+        await _job_store(
+            job_manager.update_job,
+            job_id,
+            progress=70.0,
+            current_step="Generating speech",
+        )
 
         if request.use_voice_cloning and reference_path:
-            # Use voice cloning
+            # Use voice cloning, one segment at a time: XTTS inference on
+            # the shared model is not re-entrant
             tts_results = []
             for translation in translations:
                 if translation.translated_text.strip():
-                    clone_result = voice_clone_service.clone_voice(
-                        translation.translated_text,
-                        reference_path,
-                        request.target_language,
+                    tts_results.append(
+                        await asyncio.to_thread(
+                            voice_clone_service.clone_voice,
+                            translation.translated_text,
+                            reference_path,
+                            request.target_language,
+                        )
                     )
-                    tts_results.append(clone_result)
         else:
             # Use regular TTS
-            tts_results = tts_service.synthesize_translations(
+            tts_results = await asyncio.to_thread(
+                tts_service.synthesize_translations,
                 translations,
-                request.tts_voice,
-                request.target_language,
-                request.speaking_rate,
-                request.pitch,
-                request.volume_gain_db,
+                str(file_manager.ensure_directory(job_dir)),
+                language=request.target_language,
+                voice=request.tts_voice,
+                speaking_rate=request.speaking_rate,
+                pitch=request.pitch,
+                volume_gain_db=request.volume_gain_db,
             )
 
         # Step 5: Combine and finalize
-        job_manager.update_job(job_id, progress=90.0, current_step="Finalizing")
+        await _job_store(
+            job_manager.update_job, job_id, progress=90.0, current_step="Finalizing"
+        )
 
         # Save results (placeholder - implement actual file saving)
         tts_audio_url = f"/api/v1/jobs/{job_id}/audio"
         final_video_url = f"/api/v1/jobs/{job_id}/video"
 
         # Complete job
-        job_manager.update_job(
+        await _job_store(
+            job_manager.update_job,
             job_id,
             status=ProcessingStatus.COMPLETED,
             progress=100.0,
@@ -549,8 +1014,11 @@ async def process_dubbing_job(
         logger.error(f"Error processing dubbing job {job_id}: {e}")
 
         # Update job with error
-        job_manager.update_job(
-            job_id, status=ProcessingStatus.FAILED, error_message=str(e)
+        await _job_store(
+            job_manager.update_job,
+            job_id,
+            status=ProcessingStatus.FAILED,
+            error_message=str(e),
         )
 
         # Clean up on error
@@ -563,8 +1031,13 @@ async def process_dubbing_job(
         except:
             pass
 
+    finally:
+        # Nothing reads the segment files once the job is done
+        shutil.rmtree(job_dir, ignore_errors=True)
+
 
 @router.post("/voice-clone-simple")
+@api_route
 async def voice_clone_simple(
     text: str = Form(...),
     reference_audio: UploadFile = File(...),
@@ -581,39 +1054,31 @@ async def voice_clone_simple(
     Returns:
         Cloned audio file
     """
-    try:
-        # Save uploaded reference audio
-        reference_path = file_manager.create_temp_file(
-            suffix=f".{reference_audio.filename.split('.')[-1]}"
-        )
+    # Save uploaded reference audio
+    reference_path = await _spool_upload(
+        reference_audio, suffix=_safe_suffix(reference_audio.filename)
+    )
 
-        with open(reference_path, "wb") as buffer:
-            content = await reference_audio.read()
-            buffer.write(content)
-
-        # Create output path
-        output_path = file_manager.create_temp_file(suffix=".wav")
+    # Create output path
+    output_path = file_manager.create_temp_file(suffix=".wav")
 
+    try:
         # Perform voice cloning using your function
-        success = synthesize_with_cloned_voice(text, reference_path, output_path)
-
-        if not success:
-            raise HTTPException(status_code=500, detail="Voice cloning failed")
-
+        result = await asyncio.to_thread(
+            synthesize_with_cloned_voice, text, reference_path, output_path
+        )
+    finally:
         # Clean up reference audio
         file_manager.cleanup_file(reference_path)
 
-        # Return the cloned audio file
-        return FileResponse(
-            output_path, media_type="audio/wav", filename=output_filename
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in simple voice cloning: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# Import datetime for health check
-from datetime import datetime
+    if not result["success"]:
+        file_manager.cleanup_file(output_path)
+        raise HTTPException(status_code=500, detail="Voice cloning failed")
+
+    # Return the cloned audio file, removing it once sent
+    return FileResponse(
+        output_path,
+        media_type="audio/wav",
+        filename=output_filename,
+        background=BackgroundTask(file_manager.cleanup_file, output_path),
+    )
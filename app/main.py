@@ -1,24 +1,49 @@
 import os
+import queue
+import atexit
+import asyncio
 import logging
+import logging.handlers
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from decouple import config
 import uvicorn
 
-from .api.routes import router
+from .api.routes import (
+    router,
+    dubbing_worker,
+    fail_queued_jobs,
+    DUBBING_CONCURRENCY,
+    MAX_REQUEST_SIZE,
+)
 from .services.whisper_transcribe import whisper_service
+from .services.translate import translation_service
 from .services.tts import tts_service
 from .services.voice_clone import voice_clone_service
 from .utils.helpers import file_manager, job_manager
 
-# Configure logging
+# Configure logging. Records are handed to a queue and written by a
+# listener thread so file I/O never blocks the event loop.
+_log_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+_log_handlers = [logging.FileHandler("dubbing.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("dubbing.log"), logging.StreamHandler()],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+    force=True,
 )
 logger = logging.getLogger(__name__)
 
@@ -26,16 +51,34 @@ logger = logging.getLogger(__name__)
 DEBUG = config("DEBUG", default=False, cast=bool)
 HOST = config("HOST", default="0.0.0.0")
 PORT = config("PORT", default=8000, cast=int)
+# Requests are logged by uvicorn's access logger
+ACCESS_LOG = config("ACCESS_LOG", default=True, cast=bool)
 
 # Create necessary directories
 UPLOAD_DIR = config("UPLOAD_DIR", default="uploads")
 OUTPUT_DIR = config("OUTPUT_DIR", default="outputs")
 TEMP_DIR = config("TEMP_DIR", default="temp")
 
+# Maximum number of dubbing jobs waiting for a worker
+JOB_QUEUE_SIZE = config("JOB_QUEUE_SIZE", default=64, cast=int)
+
+# Seconds shutdown waits for queued dubbing jobs before cancelling them
+SHUTDOWN_GRACE_PERIOD = config("SHUTDOWN_GRACE_PERIOD", default=10.0, cast=float)
+
 for directory in [UPLOAD_DIR, OUTPUT_DIR, TEMP_DIR]:
     os.makedirs(directory, exist_ok=True)
 
 
+def _log_warm_up_result(task: asyncio.Task) -> None:
+    """Log the outcome of a background model warm-up"""
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logger.error(f"Voice cloning warm-up failed: {task.exception()}")
+    else:
+        logger.info("Voice cloning service ready")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
@@ -60,10 +103,13 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing TTS service...")
         # TTS service is initialized in __init__
 
-        # Initialize voice cloning service
-        logger.info("Initializing voice cloning service...")
-        # Voice cloning service will be initialized on first use to avoid long startup times
-        logger.info("Voice cloning service will be initialized on first use")
+        # Load the voice cloning model in the background so startup is not
+        # blocked and the first request does not pay for the cold load
+        logger.info("Warming up voice cloning service in the background...")
+        app.state.voice_clone_warm_up = asyncio.create_task(
+            asyncio.to_thread(voice_clone_service.warm_up)
+        )
+        app.state.voice_clone_warm_up.add_done_callback(_log_warm_up_result)
 
         logger.info("All services initialized successfully")
 
@@ -71,8 +117,31 @@ async def lifespan(app: FastAPI):
         logger.error(f"Error initializing services: {e}")
         logger.warning("Some services may not be available")
 
+    # Start dubbing workers
+    app.state.job_queue = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+    workers = [
+        asyncio.create_task(dubbing_worker(app.state.job_queue))
+        for _ in range(DUBBING_CONCURRENCY)
+    ]
+    logger.info(f"Started {len(workers)} dubbing workers")
+
     yield
 
+    # Give queued jobs a bounded time to finish, then stop the workers and
+    # fail whatever is left rather than holding up shutdown
+    try:
+        await asyncio.wait_for(
+            app.state.job_queue.join(), timeout=SHUTDOWN_GRACE_PERIOD
+        )
+    except asyncio.TimeoutError:
+        pass
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    dropped = await fail_queued_jobs(app.state.job_queue)
+    if dropped:
+        logger.warning(f"Dropped {dropped} queued dubbing jobs at shutdown")
+
     # Cleanup on shutdown
     logger.info("Shutting down Dubbing API server...")
     logger.info("=" * 50)
@@ -83,6 +152,7 @@ async def lifespan(app: FastAPI):
         # Cleanup services
         whisper_service.cleanup()
         voice_clone_service.cleanup()
+        translation_service.close()
 
         logger.info("Services cleaned up successfully")
 
@@ -90,6 +160,54 @@ async def lifespan(app: FastAPI):
         logger.error(f"Error during cleanup: {e}")
 
 
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies larger than a limit before they are parsed
+
+    Requests announcing an oversized Content-Length are answered with 413
+    straight away. Bodies without one are counted as they are received, so
+    the multipart parser never spools more than the limit to disk.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    too_large = int(value) > self.max_body_size
+                except ValueError:
+                    too_large = False
+                if too_large:
+                    response = JSONResponse(
+                        status_code=413, content={"detail": "Request body too large"}
+                    )
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise HTTPException(
+                        status_code=413, detail="Request body too large"
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Dubbing API",
@@ -107,14 +225,18 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
     debug=DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
+# Enforce the upload size limit before the body is parsed
+app.add_middleware(BodySizeLimitMiddleware, max_body_size=MAX_REQUEST_SIZE)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_credentials=False,  # No cookie or session auth
+    allow_methods=["GET", "POST", "DELETE"],
     allow_headers=["*"],
 )
 
@@ -133,16 +255,6 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests"""
-    logger.info(f"{request.method} {request.url}")
-    response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
-    return response
-
-
 # Include API routes
 app.include_router(router)
 
@@ -165,4 +277,11 @@ if os.path.exists(OUTPUT_DIR):
 
 if __name__ == "__main__":
     # Run the server
-    uvicorn.run("app.main:app", host=HOST, port=PORT, reload=DEBUG, log_level="info")
+    uvicorn.run(
+        "app.main:app",
+        host=HOST,
+        port=PORT,
+        reload=DEBUG,
+        log_level="info",
+        access_log=ACCESS_LOG,
+    )
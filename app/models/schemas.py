@@ -1,7 +1,15 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
+# Settings for models built in bulk (hundreds per job)
+HOT_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    validate_assignment=False,
+    extra="ignore",
+    populate_by_name=True,
+)
+
 
 class AudioFormat(str, Enum):
     MP3 = "mp3"
@@ -68,6 +76,8 @@ class VoiceCloningRequest(BaseModel):
 
 
 class TranscriptionSegment(BaseModel):
+    model_config = HOT_MODEL_CONFIG
+
     id: int
     start_time: float
     end_time: float
@@ -77,6 +87,8 @@ class TranscriptionSegment(BaseModel):
 
 
 class TranscriptionResult(BaseModel):
+    model_config = HOT_MODEL_CONFIG
+
     segments: List[TranscriptionSegment]
     detected_language: Optional[str] = None
     total_duration: float
@@ -88,6 +100,8 @@ class TranscriptionResult(BaseModel):
 
 
 class TranslationResult(BaseModel):
+    model_config = HOT_MODEL_CONFIG
+
     original_text: str
     translated_text: str
     source_language: str
@@ -1,9 +1,15 @@
 import os
+import wave
+import asyncio
+import functools
+import shutil
 import logging
 import tempfile
-import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List
 
 try:
     import ffmpeg
@@ -15,10 +21,106 @@ except ImportError:
 
 from pydub import AudioSegment
 from ..models.schemas import AudioExtractionResult, AudioFormat
-from ..utils.helpers import file_manager, ErrorHandler
+from ..utils.helpers import file_manager, ErrorHandler, probe_media
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from FFmpeg's stdout at a time when piping PCM audio (1MB)
+PCM_CHUNK_SIZE = 1 << 20
+
+# FFmpeg audio encoder for each output format
+_AUDIO_CODECS = MappingProxyType(
+    {
+        AudioFormat.WAV: "pcm_s16le",
+        AudioFormat.FLAC: "flac",
+        AudioFormat.M4A: "aac",
+        AudioFormat.MP3: "libmp3lame",
+    }
+)
+
+# Rough memory needed by one FFmpeg extraction, used to size batch pools
+EXTRACTION_MEMORY_PER_JOB = 512 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _is_ffmpeg_installed() -> bool:
+    """Check once per process whether FFmpeg can be used"""
+    if shutil.which("ffmpeg") is not None:
+        logger.info("FFmpeg is available in system PATH")
+        return True
+
+    # Check if ffmpeg-python is available
+    if not FFMPEG_AVAILABLE:
+        logger.warning(
+            "FFmpeg not found in system PATH and ffmpeg-python not available"
+        )
+        return False
+
+    logger.info("ffmpeg-python library is available")
+    return True
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file, avoiding a byte-wise copy where the filesystem allows it
+
+    Tries a hard link first, then an in-kernel copy_file_range (which
+    reflinks on filesystems that support it), then shutil.copy2.
+    """
+    try:
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
+
+
+def _available_memory() -> Optional[int]:
+    """Get the available physical memory in bytes, if the platform reports it"""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _extract_audio_worker(job: tuple) -> AudioExtractionResult:
+    """Extract audio from one video in a batch worker process"""
+    video_path, output_path, kwargs = job
+    try:
+        return audio_extraction_service.extract_audio_from_video(
+            video_path, output_path, **kwargs
+        )
+    except Exception as e:
+        audio_format = kwargs.get("audio_format", AudioFormat.WAV)
+        return AudioExtractionResult(
+            audio_file_path=output_path,
+            duration=0.0,
+            sample_rate=kwargs.get("sample_rate", 22050),
+            channels=kwargs.get("channels", 1),
+            format=audio_format,
+            success=False,
+            error_message=str(e),
+            metadata={"source_file": video_path},
+        )
+
 
 class AudioExtractionService:
     """Service for extracting audio from video files using FFmpeg"""
@@ -34,6 +136,9 @@ class AudioExtractionService:
             ".3gp",
         ]
         self.supported_audio_formats = [".mp3", ".wav", ".m4a", ".aac", ".flac", ".ogg"]
+        # Hashed copies for extension lookups
+        self._video_exts = frozenset(self.supported_video_formats)
+        self._audio_exts = frozenset(self.supported_audio_formats)
         self.default_audio_format = AudioFormat.WAV
         self.default_sample_rate = 22050
         self.default_channels = 1
@@ -41,30 +146,7 @@ class AudioExtractionService:
 
     def _check_ffmpeg_availability(self) -> bool:
         """Check if FFmpeg is available in the system"""
-        try:
-            # Try to run ffmpeg command
-            result = subprocess.run(
-                ["ffmpeg", "-version"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                logger.info("FFmpeg is available in system PATH")
-                return True
-        except (
-            subprocess.TimeoutExpired,
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-        ):
-            pass
-
-        # Check if ffmpeg-python is available
-        if not FFMPEG_AVAILABLE:
-            logger.warning(
-                "FFmpeg not found in system PATH and ffmpeg-python not available"
-            )
-            return False
-
-        logger.info("ffmpeg-python library is available")
-        return True
+        return _is_ffmpeg_installed()
 
     def extract_audio_from_video(
         self,
@@ -115,12 +197,19 @@ class AudioExtractionService:
                 )
 
             # Extract audio using FFmpeg
-            self._extract_with_ffmpeg(
+            duration = self._extract_with_ffmpeg(
                 video_path, output_path, audio_format, sample_rate, channels
             )
 
-            # Get audio information
-            audio_info = self._get_audio_info(output_path)
+            if duration is not None:
+                audio_info = {
+                    "duration": duration,
+                    "sample_rate": sample_rate,
+                    "channels": channels,
+                }
+            else:
+                # Get audio information
+                audio_info = self._get_audio_info(output_path)
 
             result = AudioExtractionResult(
                 audio_file_path=output_path,
@@ -137,6 +226,148 @@ class AudioExtractionService:
             logger.error(f"Error extracting audio from video: {e}")
             raise
 
+    async def extract_audio_from_video_async(
+        self,
+        video_path: str,
+        output_path: Optional[str] = None,
+        audio_format: AudioFormat = AudioFormat.WAV,
+        sample_rate: int = 22050,
+        channels: int = 1,
+    ) -> AudioExtractionResult:
+        """
+        Extract audio from video file without blocking the event loop
+
+        WAV extraction from video runs FFmpeg as an asyncio subprocess; other
+        cases run extract_audio_from_video in a worker thread.
+
+        Args:
+            video_path: Path to the input video file
+            output_path: Path for the output audio file
+            audio_format: Desired audio format
+            sample_rate: Audio sample rate
+            channels: Number of audio channels
+
+        Returns:
+            AudioExtractionResult with extracted audio information
+        """
+        if (
+            audio_format != AudioFormat.WAV
+            or not self.ffmpeg_available
+            or not self._is_valid_video_file(video_path)
+            or not os.path.exists(video_path)
+        ):
+            return await asyncio.to_thread(
+                self.extract_audio_from_video,
+                video_path,
+                output_path,
+                audio_format,
+                sample_rate,
+                channels,
+            )
+
+        if output_path is None:
+            output_path = file_manager.create_temp_file(suffix=f".{audio_format.value}")
+
+        args = (
+            ffmpeg.input(video_path)
+            .output(
+                output_path,
+                format="wav",
+                acodec="pcm_s16le",
+                ar=sample_rate,
+                ac=channels,
+                loglevel="error",
+                vn=None,
+                sn=None,
+                dn=None,
+            )
+            .overwrite_output()
+            .compile()
+        )
+
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+
+        if process.returncode != 0:
+            error = stderr.decode(errors="replace").strip()
+            logger.error(f"Error extracting audio from video: {error}")
+            raise RuntimeError(f"FFmpeg extraction failed: {error}")
+
+        # The WAV header gives the duration without another probe
+        with wave.open(output_path, "rb") as wav:
+            duration = wav.getnframes() / wav.getframerate()
+
+        logger.info(f"Successfully extracted audio from {video_path}")
+        return AudioExtractionResult(
+            audio_file_path=output_path,
+            duration=duration,
+            sample_rate=sample_rate,
+            channels=channels,
+            format=audio_format,
+        )
+
+    def batch_extract_audio(
+        self,
+        video_paths: List[str],
+        output_dir: str,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[AudioExtractionResult]:
+        """
+        Extract audio from several videos in parallel FFmpeg processes
+
+        Args:
+            video_paths: Paths to the input video files
+            output_dir: Directory for the extracted audio files
+            max_workers: Maximum number of concurrent extractions (defaults to
+                the CPU count, limited by available memory)
+            **kwargs: Options passed to extract_audio_from_video
+
+        Returns:
+            AudioExtractionResult for each video, in input order. Failed
+            extractions have success set to False.
+        """
+        if not video_paths:
+            return []
+
+        audio_format = kwargs.get("audio_format", AudioFormat.WAV)
+        file_manager.ensure_directory(output_dir)
+
+        jobs = []
+        for i, video_path in enumerate(video_paths):
+            stem = Path(video_path).stem
+            output_path = os.path.join(output_dir, f"{stem}_{i}.{audio_format.value}")
+            jobs.append((video_path, output_path, kwargs))
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+            memory = _available_memory()
+            if memory is not None:
+                max_workers = min(
+                    max_workers, max(1, memory // EXTRACTION_MEMORY_PER_JOB)
+                )
+        max_workers = max(1, min(max_workers, len(jobs)))
+
+        logger.info(
+            f"Extracting audio from {len(jobs)} files with {max_workers} workers"
+        )
+
+        # Spawn rather than fork so workers do not inherit loaded models
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return list(executor.map(_extract_audio_worker, jobs))
+
     def extract_audio_from_audio(
         self,
         audio_path: str,
@@ -174,18 +405,15 @@ class AudioExtractionService:
                 )
 
             # Process audio using pydub
-            self._process_with_pydub(
+            duration = self._process_with_pydub(
                 audio_path, output_path, audio_format, sample_rate, channels
             )
 
-            # Get audio information
-            audio_info = self._get_audio_info(output_path)
-
             result = AudioExtractionResult(
                 audio_file_path=output_path,
-                duration=audio_info["duration"],
-                sample_rate=audio_info["sample_rate"],
-                channels=audio_info["channels"],
+                duration=duration,
+                sample_rate=sample_rate,
+                channels=channels,
                 format=audio_format,
             )
 
@@ -203,27 +431,132 @@ class AudioExtractionService:
         audio_format: AudioFormat,
         sample_rate: int,
         channels: int,
-    ) -> None:
-        """Extract audio using FFmpeg"""
+    ) -> Optional[float]:
+        """
+        Extract audio using FFmpeg
+
+        WAV output is written from FFmpeg's raw PCM stream, so its duration is
+        known without probing the file again.
+
+        Returns:
+            Duration in seconds for WAV output, None otherwise
+        """
+        if audio_format == AudioFormat.WAV:
+            return self._extract_wav_with_ffmpeg(
+                video_path, output_path, sample_rate, channels
+            )
+
         try:
             # Build FFmpeg command
             stream = ffmpeg.input(video_path)
             stream = ffmpeg.output(
                 stream,
                 output_path,
-                acodec="pcm_s16le" if audio_format == AudioFormat.WAV else "libmp3lame",
+                acodec=_AUDIO_CODECS[audio_format],
                 ar=sample_rate,
                 ac=channels,
                 loglevel="error",
+                # Only the audio stream is needed, skip video decoding
+                vn=None,
+                sn=None,
+                dn=None,
             )
 
             # Run FFmpeg command
             ffmpeg.run(stream, overwrite_output=True)
+            return None
 
         except ffmpeg.Error as e:
             logger.error(f"FFmpeg error: {e}")
             raise RuntimeError(f"FFmpeg extraction failed: {e}")
 
+    def _extract_wav_with_ffmpeg(
+        self, video_path: str, output_path: str, sample_rate: int, channels: int
+    ) -> float:
+        """Stream 16-bit PCM from FFmpeg into a WAV file and return its duration"""
+        process = (
+            ffmpeg.input(video_path)
+            .output(
+                "pipe:",
+                format="s16le",
+                acodec="pcm_s16le",
+                ar=sample_rate,
+                ac=channels,
+                loglevel="error",
+                vn=None,
+                sn=None,
+                dn=None,
+            )
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+
+        frames = 0
+        try:
+            with wave.open(output_path, "wb") as out:
+                out.setnchannels(channels)
+                out.setsampwidth(2)
+                out.setframerate(sample_rate)
+
+                while chunk := process.stdout.read(PCM_CHUNK_SIZE):
+                    out.writeframesraw(chunk)
+                    frames += len(chunk) // (2 * channels)
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            process.wait()
+
+        if process.returncode != 0:
+            error = stderr.decode(errors="replace").strip()
+            logger.error(f"FFmpeg error: {error}")
+            raise RuntimeError(f"FFmpeg extraction failed: {error}")
+
+        return frames / sample_rate
+
+    def _decode_pcm(self, audio_path: str, sample_rate: int, channels: int) -> bytes:
+        """Decode a media file to 16-bit PCM in memory with FFmpeg"""
+        try:
+            raw, _ = (
+                ffmpeg.input(audio_path)
+                .output(
+                    "pipe:",
+                    format="s16le",
+                    acodec="pcm_s16le",
+                    ar=sample_rate,
+                    ac=channels,
+                    loglevel="error",
+                )
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+            return raw
+
+        except ffmpeg.Error as e:
+            logger.error(f"FFmpeg error: {e}")
+            raise RuntimeError(f"FFmpeg decoding failed: {e}")
+
+    def load_audio_segment(
+        self, audio_path: str, sample_rate: int = 22050, channels: int = 1
+    ) -> AudioSegment:
+        """
+        Load a media file as a resampled pydub AudioSegment
+
+        Args:
+            audio_path: Path to the audio or video file
+            sample_rate: Audio sample rate
+            channels: Number of audio channels
+
+        Returns:
+            AudioSegment holding 16-bit PCM audio
+        """
+        if not self.ffmpeg_available:
+            audio = AudioSegment.from_file(audio_path)
+            return audio.set_frame_rate(sample_rate).set_channels(channels)
+
+        raw = self._decode_pcm(audio_path, sample_rate, channels)
+        return AudioSegment(
+            data=raw, sample_width=2, frame_rate=sample_rate, channels=channels
+        )
+
     def _process_with_pydub(
         self,
         audio_path: str,
@@ -231,13 +564,20 @@ class AudioExtractionService:
         audio_format: AudioFormat,
         sample_rate: int,
         channels: int,
-    ) -> None:
-        """Process audio using pydub"""
+    ) -> float:
+        """Convert audio to the target format and return its duration in seconds"""
         try:
-            # Load audio file
-            audio = AudioSegment.from_file(audio_path)
+            # Convert in a single FFmpeg pass without loading the waveform
+            if self.ffmpeg_available:
+                duration = self._extract_with_ffmpeg(
+                    audio_path, output_path, audio_format, sample_rate, channels
+                )
+                if duration is None:
+                    duration = self._get_audio_info(output_path)["duration"]
+                return duration
 
-            # Set sample rate and channels
+            # Fall back to pydub when FFmpeg is not available
+            audio = AudioSegment.from_file(audio_path)
             audio = audio.set_frame_rate(sample_rate)
             audio = audio.set_channels(channels)
 
@@ -248,6 +588,8 @@ class AudioExtractionService:
                 parameters=["-ac", str(channels), "-ar", str(sample_rate)],
             )
 
+            return len(audio) / 1000.0
+
         except Exception as e:
             logger.error(f"Pydub processing error: {e}")
             raise RuntimeError(f"Audio processing failed: {e}")
@@ -255,7 +597,7 @@ class AudioExtractionService:
     def _get_audio_info(self, audio_path: str) -> Dict[str, Any]:
         """Get audio file information"""
         try:
-            probe = ffmpeg.probe(audio_path)
+            probe = probe_media(audio_path)
             audio_stream = next(
                 (
                     stream
@@ -294,7 +636,7 @@ class AudioExtractionService:
         """Check if file is a valid video file"""
         try:
             ext = os.path.splitext(file_path)[1].lower()
-            return ext in self.supported_video_formats
+            return ext in self._video_exts
         except Exception:
             return False
 
@@ -302,7 +644,7 @@ class AudioExtractionService:
         """Check if file is a valid audio file"""
         try:
             ext = os.path.splitext(file_path)[1].lower()
-            return ext in self.supported_audio_formats
+            return ext in self._audio_exts
         except Exception:
             return False
 
@@ -316,14 +658,15 @@ class AudioExtractionService:
     def validate_file(self, file_path: str) -> Dict[str, Any]:
         """Validate input file"""
         try:
-            if not os.path.exists(file_path):
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return {"valid": False, "error": "File not found"}
 
             ext = os.path.splitext(file_path)[1].lower()
-            file_size = os.path.getsize(file_path)
 
-            is_video = ext in self.supported_video_formats
-            is_audio = ext in self.supported_audio_formats
+            is_video = ext in self._video_exts
+            is_audio = ext in self._audio_exts
 
             if not (is_video or is_audio):
                 return {"valid": False, "error": "Unsupported file format"}
@@ -332,7 +675,7 @@ class AudioExtractionService:
                 "valid": True,
                 "type": "video" if is_video else "audio",
                 "extension": ext,
-                "size": file_size,
+                "size": st.st_size,
             }
 
         except Exception as e:
@@ -397,9 +740,7 @@ class AudioExtractionService:
 
             # If output path is different from input, copy the file
             if output_path != audio_path:
-                import shutil
-
-                shutil.copy2(audio_path, output_path)
+                _fast_copy(audio_path, output_path)
                 logger.info(f"Audio file copied to: {output_path}")
 
             # Get audio information
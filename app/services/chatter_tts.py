@@ -1,14 +1,89 @@
+"""
+Text-to-speech service using Chatterbox TTS
+"""
+
+import logging
+import threading
+from typing import Optional, Tuple
+
+import torch
 import torchaudio as ta
 from chatterbox.tts import ChatterboxTTS
-from translate import TranslationResult
 
-model = ChatterboxTTS.from_pretrained(device="cuda")
+logger = logging.getLogger(__name__)
+
+
+class ChatterTTSService:
+    """Service for speech synthesis with a resident Chatterbox model"""
+
+    def __init__(self):
+        self._model = None
+        self._load_lock = threading.Lock()
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    def _get_model(self) -> ChatterboxTTS:
+        """Load the Chatterbox model on first use and return it"""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    logger.info(
+                        f"Loading Chatterbox TTS model on device: {self.device}"
+                    )
+                    self._model = ChatterboxTTS.from_pretrained(device=self.device)
+                    logger.info("Chatterbox TTS model loaded successfully")
+        return self._model
+
+    def synthesize(
+        self, text: str, audio_prompt_path: Optional[str] = None
+    ) -> Tuple[torch.Tensor, int]:
+        """
+        Synthesize speech from text
+
+        Args:
+            text: Text to synthesize
+            audio_prompt_path: Reference audio for the voice (default voice if None)
+
+        Returns:
+            Tuple of the generated waveform and its sample rate
+        """
+        model = self._get_model()
+
+        # No autograd, and bfloat16 matmuls on GPU
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device,
+            dtype=torch.bfloat16,
+            enabled=self.device == "cuda",
+        ):
+            wav = model.generate(text, audio_prompt_path=audio_prompt_path)
+
+        return wav.float(), model.sr
+
+    def synthesize_to_file(
+        self, text: str, output_path: str, audio_prompt_path: Optional[str] = None
+    ) -> str:
+        """
+        Synthesize speech from text and save it to a file
+
+        Args:
+            text: Text to synthesize
+            output_path: Path for the output audio file
+            audio_prompt_path: Reference audio for the voice (default voice if None)
+
+        Returns:
+            Path to the saved audio file
+        """
+        wav, sample_rate = self.synthesize(text, audio_prompt_path)
+        ta.save(output_path, wav, sample_rate)
+        return output_path
+
+    def cleanup(self) -> None:
+        """Release the loaded model"""
+        if self._model is not None:
+            self._model = None
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            logger.info("Chatterbox TTS model cleaned up")
 
-text = TranslationResult()
-wav = model.generate(text)
-ta.save("reference_audio-[AudioTrimmer.com].wav", wav, model.sr)
 
-# If you want to synthesize with a different voice, specify the audio prompt
-AUDIO_PROMPT_PATH = "reference_audio.wav"
-wav = model.generate(text, audio_prompt_path=AUDIO_PROMPT_PATH)
-ta.save("cloned_audio.wav", wav, model.sr)
\ No newline at end of file
+# Global instance
+chatter_tts_service = ChatterTTSService()
@@ -0,0 +1,107 @@
+"""
+Local machine translation with MarianMT models, usable in place of googletrans
+"""
+
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple, Union
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+# Hugging Face model for each language pair
+MARIAN_MODEL_TEMPLATE = config(
+    "TRANSLATE_MARIAN_MODEL", default="Helsinki-NLP/opus-mt-{src}-{dest}"
+)
+
+# Texts translated per forward pass
+TRANSLATE_BATCH_SIZE = config("TRANSLATE_BATCH_SIZE", default=16, cast=int)
+
+
+def _marian_code(language: str) -> str:
+    """Map a googletrans language code to the OPUS-MT one (zh-cn -> zh)"""
+    return language.split("-")[0].lower()
+
+
+class LocalTranslator:
+    """MarianMT translator exposing the googletrans translate/detect interface"""
+
+    def __init__(self, detector: Any = None):
+        """
+        Args:
+            detector: googletrans Translator used to detect 'auto' sources
+        """
+        self._detector = detector
+        self._pipelines: Dict[Tuple[str, str], Tuple[Any, threading.Lock]] = {}
+        self._load_lock = threading.Lock()
+
+        try:
+            import torch
+
+            self.device = 0 if torch.cuda.is_available() else -1
+        except ImportError:
+            self.device = -1
+
+    def _get_pipeline(self, src: str, dest: str) -> Tuple[Any, threading.Lock]:
+        """Load the translation pipeline for a language pair on first use"""
+        key = (src, dest)
+        entry = self._pipelines.get(key)
+        if entry is None:
+            with self._load_lock:
+                entry = self._pipelines.get(key)
+                if entry is None:
+                    from transformers import pipeline
+
+                    model_name = MARIAN_MODEL_TEMPLATE.format(src=src, dest=dest)
+                    logger.info(f"Loading translation model {model_name}")
+                    entry = (
+                        pipeline("translation", model=model_name, device=self.device),
+                        threading.Lock(),
+                    )
+                    self._pipelines[key] = entry
+        return entry
+
+    def detect(self, text: str) -> Any:
+        """Detect the language of text with the fallback detector"""
+        if self._detector is None:
+            raise ValueError("Source language detection is not available")
+        return self._detector.detect(text)
+
+    def translate(
+        self, text: Union[str, List[str]], src: str = "auto", dest: str = "en"
+    ) -> Any:
+        """
+        Translate text, or a list of texts in batches
+
+        Args:
+            text: Text or list of texts to translate
+            src: Source language code or 'auto' to detect it from the first text
+            dest: Target language code
+
+        Returns:
+            Result with origin, text, src and dest attributes, or a list of
+            them when given a list
+        """
+        texts = text if isinstance(text, list) else [text]
+        if not texts:
+            return []
+
+        if src == "auto":
+            src = self.detect(texts[0]).lang
+
+        translator, lock = self._get_pipeline(_marian_code(src), _marian_code(dest))
+        # Tokenizers are not safe to share between threads
+        with lock:
+            outputs = translator(texts, batch_size=TRANSLATE_BATCH_SIZE)
+
+        results = [
+            SimpleNamespace(
+                origin=original,
+                text=output["translation_text"],
+                src=src,
+                dest=dest,
+            )
+            for original, output in zip(texts, outputs)
+        ]
+        return results if isinstance(text, list) else results[0]
@@ -1,22 +1,96 @@
 import os
+import re
+import asyncio
 import logging
-import requests
-from typing import Optional, Dict, Any, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from decouple import config
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from googletrans import Translator, LANGUAGES
+from .local_translate import LocalTranslator
 from ..models.schemas import TranslationResult, TranscriptionSegment
 from ..utils.helpers import ErrorHandler
 
 logger = logging.getLogger(__name__)
 
+# Number of translation requests sent concurrently
+TRANSLATE_WORKERS = config("TRANSLATE_WORKERS", default=8, cast=int)
+
+# Number of async translation calls allowed in flight at once
+TRANSLATE_CONCURRENCY = config("TRANSLATE_CONCURRENCY", default=16, cast=int)
+
+# Translation backend: "google" (googletrans) or "marian" (local MarianMT models,
+# with Google only used to detect 'auto' source languages)
+TRANSLATE_BACKEND = config("TRANSLATE_BACKEND", default="google").lower()
+
 
 class TranslationService:
     """Service for translating text using Google Translate API"""
 
     def __init__(self):
-        self.translator = Translator()
+        if TRANSLATE_BACKEND == "marian":
+            self.translator = LocalTranslator(detector=Translator())
+        else:
+            self.translator = Translator()
         self.supported_languages = LANGUAGES
+        self._lang_view = MappingProxyType(LANGUAGES)
         self.language_codes = list(LANGUAGES.keys())
         self.max_text_length = 5000  # Google Translate limit
+        if TRANSLATE_BACKEND == "marian":
+            # Stay well inside MarianMT's 512 token input window
+            self.max_text_length = 1000
+        self._sent_re = re.compile(r"[^.!?]+(?:[.!?]+|$)")
+
+        # LRU cache of translations keyed on (text, source, target)
+        self._cache: "OrderedDict[tuple, TranslationResult]" = OrderedDict()
+        self._cache_max = 4096
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=TRANSLATE_WORKERS, thread_name_prefix="translate"
+        )
+        self._async_sem = asyncio.Semaphore(TRANSLATE_CONCURRENCY)
+
+    def _cache_get(
+        self, text: str, source_language: str, target_language: str
+    ) -> Optional[TranslationResult]:
+        """Look up a cached translation, counting the hit or miss"""
+        key = (text.strip(), source_language, target_language)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                self._cache_misses += 1
+                return None
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+
+        if result.original_text != text:
+            result = result.model_copy(update={"original_text": text})
+        return result
+
+    def _cache_put(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        result: TranslationResult,
+    ) -> None:
+        """Store a translation, evicting the least recently used ones"""
+        key = (text.strip(), source_language, target_language)
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached translations"""
+        with self._cache_lock:
+            self._cache.clear()
 
     def translate_text(
         self, text: str, source_language: str = "auto", target_language: str = "en"
@@ -44,9 +118,23 @@ class TranslationService:
             if source_language != "auto" and source_language not in self.language_codes:
                 raise ValueError(f"Unsupported source language: {source_language}")
 
+            # Nothing to translate
+            if source_language == target_language:
+                return self._untranslated(text, source_language)
+
+            cached = self._cache_get(text, source_language, target_language)
+            if cached is not None:
+                return cached
+
             # Handle long text by splitting into chunks
             if len(text) > self.max_text_length:
-                return self._translate_long_text(text, source_language, target_language)
+                translation_result = self._translate_long_text(
+                    text, source_language, target_language
+                )
+                self._cache_put(
+                    text, source_language, target_language, translation_result
+                )
+                return translation_result
 
             # Perform translation
             logger.info(f"Translating text from {source_language} to {target_language}")
@@ -63,6 +151,8 @@ class TranslationService:
                 confidence_score=self._calculate_confidence_score(result),
             )
 
+            self._cache_put(text, source_language, target_language, translation_result)
+
             logger.info(
                 f"Translation completed. Source: {result.src}, Target: {target_language}"
             )
@@ -95,35 +185,38 @@ class TranslationService:
 
             results = []
 
-            # Detect source language from first segment if auto
-            if source_language == "auto" and segments:
-                detected_lang = self.detect_language(segments[0].text)
-                source_language = detected_lang["language"]
-                logger.info(f"Auto-detected source language: {source_language}")
+            texts = [segment.text for segment in segments if segment.text.strip()]
+            translations = []
+
+            # Detect the source language from the first translation if auto,
+            # and translate the remaining segments from it
+            if source_language == "auto" and texts:
+                first = self._safe_translate(texts[0], source_language, target_language)
+                translations.append(first)
+                texts = texts[1:]
+                if first.source_language != "auto":
+                    source_language = first.source_language
+                    logger.info(f"Auto-detected source language: {source_language}")
+
+            # Translate all non-empty segments in one call when the backend
+            # takes lists (googletrans does not), otherwise concurrently one
+            # by one
+            batch = None
+            if source_language == target_language:
+                batch = [self._untranslated(text, source_language) for text in texts]
+            elif isinstance(self.translator, LocalTranslator):
+                batch = self._translate_batch(texts, source_language, target_language)
+            if batch is None:
+                batch = self.translate_many(texts, source_language, target_language)
+            translations.extend(batch)
+            translations = iter(translations)
 
-            # Translate each segment
             for segment in segments:
                 if segment.text.strip():
-                    try:
-                        translation = self.translate_text(
-                            segment.text, source_language, target_language
-                        )
-                        results.append(translation)
-
-                    except Exception as e:
-                        logger.error(f"Error translating segment {segment.id}: {e}")
-                        # Create fallback result
-                        fallback_result = TranslationResult(
-                            original_text=segment.text,
-                            translated_text=segment.text,  # Keep original if translation fails
-                            source_language=source_language,
-                            target_language=target_language,
-                            confidence_score=0.0,
-                        )
-                        results.append(fallback_result)
+                    results.append(next(translations))
                 else:
                     # Empty segment
-                    empty_result = TranslationResult(
+                    empty_result = TranslationResult.model_construct(
                         original_text="",
                         translated_text="",
                         source_language=source_language,
@@ -139,28 +232,168 @@ class TranslationService:
             logger.error(f"Error translating segments: {e}")
             raise RuntimeError(f"Segment translation failed: {e}")
 
+    async def atranslate_text(
+        self, text: str, source_language: str = "auto", target_language: str = "en"
+    ) -> TranslationResult:
+        """
+        Translate text without blocking the event loop
+
+        Args:
+            text: Text to translate
+            source_language: Source language code (auto for auto-detection)
+            target_language: Target language code
+
+        Returns:
+            TranslationResult with translation and metadata
+        """
+        async with self._async_sem:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool,
+                self.translate_text,
+                text,
+                source_language,
+                target_language,
+            )
+
+    async def atranslate_segments(
+        self,
+        segments: List[TranscriptionSegment],
+        source_language: str = "auto",
+        target_language: str = "en",
+    ) -> List[TranslationResult]:
+        """
+        Translate transcription segments without blocking the event loop
+
+        Args:
+            segments: List of transcription segments
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            List of TranslationResult objects
+        """
+        async with self._async_sem:
+            return await asyncio.to_thread(
+                self.translate_segments, segments, source_language, target_language
+            )
+
+    def _untranslated(self, text: str, language: str) -> TranslationResult:
+        """Build the result for text already in the target language"""
+        return TranslationResult.model_construct(
+            original_text=text,
+            translated_text=text,
+            source_language=language,
+            target_language=language,
+            confidence_score=1.0,
+        )
+
+    def _safe_translate(
+        self, text: str, source_language: str, target_language: str
+    ) -> TranslationResult:
+        """Translate text, keeping the original if translation fails"""
+        try:
+            return self.translate_text(text, source_language, target_language)
+
+        except Exception as e:
+            logger.error(f"Error translating text {text[:50]!r}: {e}")
+            # Create fallback result
+            return TranslationResult.model_construct(
+                original_text=text,
+                translated_text=text,  # Keep original if translation fails
+                source_language=source_language,
+                target_language=target_language,
+                confidence_score=0.0,
+            )
+
+    def _translate_batch(
+        self, texts: List[str], source_language: str, target_language: str
+    ) -> Optional[List[TranslationResult]]:
+        """
+        Translate several texts with a single translator call
+
+        Only LocalTranslator accepts a list of texts; googletrans 4.0.0rc1
+        sends the list as one malformed request.
+
+        Args:
+            texts: Non-empty texts to translate
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            TranslationResult objects in input order, or None if the texts
+            could not be translated as a batch
+        """
+        if not texts:
+            return []
+
+        # Long texts need chunking, leave them to translate_text
+        if any(len(text) > self.max_text_length for text in texts):
+            return None
+
+        try:
+            if target_language not in self.language_codes:
+                raise ValueError(f"Unsupported target language: {target_language}")
+
+            if source_language != "auto" and source_language not in self.language_codes:
+                raise ValueError(f"Unsupported source language: {source_language}")
+
+            results = [
+                self._cache_get(text, source_language, target_language)
+                for text in texts
+            ]
+            missing = [text for text, result in zip(texts, results) if result is None]
+
+            if missing:
+                translated = self.translator.translate(
+                    missing, src=source_language, dest=target_language
+                )
+
+                if len(translated) != len(missing):
+                    raise ValueError(
+                        f"Expected {len(missing)} translations, got {len(translated)}"
+                    )
+
+                fresh = iter(translated)
+                for i, text in enumerate(texts):
+                    if results[i] is not None:
+                        continue
+                    result = next(fresh)
+                    # Per-segment results are built from trusted values, so
+                    # skip model validation on this hot path
+                    results[i] = TranslationResult.model_construct(
+                        original_text=text,
+                        translated_text=result.text,
+                        source_language=result.src,
+                        target_language=target_language,
+                        confidence_score=self._calculate_confidence_score(result),
+                    )
+                    self._cache_put(text, source_language, target_language, results[i])
+
+            return results
+
+        except Exception as e:
+            logger.warning(f"Batch translation failed, translating one by one: {e}")
+            return None
+
     def _translate_long_text(
         self, text: str, source_language: str, target_language: str
     ) -> TranslationResult:
         """Translate long text by splitting into chunks"""
         try:
-            # Split text into sentences
-            sentences = self._split_into_sentences(text)
-
-            # Group sentences into chunks
+            # Group sentence spans into chunks, slicing each chunk out once
             chunks = []
-            current_chunk = ""
+            chunk_start = last_end = None
 
-            for sentence in sentences:
-                if len(current_chunk + sentence) > self.max_text_length:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = sentence
-                else:
-                    current_chunk += sentence
+            for start, end in self._split_into_sentences(text):
+                if chunk_start is None:
+                    chunk_start = start
+                elif end - chunk_start > self.max_text_length:
+                    chunks.append(text[chunk_start:last_end].strip())
+                    chunk_start = start
+                last_end = end
 
-            if current_chunk:
-                chunks.append(current_chunk.strip())
+            if chunk_start is not None:
+                chunks.append(text[chunk_start:last_end].strip())
 
             # Translate each chunk
             translated_chunks = []
@@ -191,13 +424,10 @@ class TranslationService:
             logger.error(f"Error in long text translation: {e}")
             raise RuntimeError(f"Long text translation failed: {e}")
 
-    def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences"""
-        import re
-
+    def _split_into_sentences(self, text: str) -> List[Tuple[int, int]]:
+        """Split text into sentences, returning their (start, end) offsets"""
         # Simple sentence splitting - can be improved with proper NLP
-        sentences = re.split(r"[.!?]+", text)
-        return [s.strip() + "." for s in sentences if s.strip()]
+        return [m.span() for m in self._sent_re.finditer(text)]
 
     def _calculate_confidence_score(self, translation_result) -> float:
         """Calculate confidence score for translation"""
@@ -252,9 +482,9 @@ class TranslationService:
             logger.error(f"Error detecting language: {e}")
             raise RuntimeError(f"Language detection failed: {e}")
 
-    def get_supported_languages(self) -> Dict[str, str]:
-        """Get supported languages"""
-        return self.supported_languages.copy()
+    def get_supported_languages(self) -> Mapping[str, str]:
+        """Get supported languages as a read-only mapping"""
+        return self._lang_view
 
     def is_language_supported(self, language_code: str) -> bool:
         """Check if language is supported"""
@@ -281,24 +511,7 @@ class TranslationService:
             if not texts:
                 return []
 
-            results = []
-
-            for i, text in enumerate(texts):
-                try:
-                    result = self.translate_text(text, source_language, target_language)
-                    results.append(result)
-
-                except Exception as e:
-                    logger.error(f"Error translating text {i}: {e}")
-                    # Create fallback result
-                    fallback_result = TranslationResult(
-                        original_text=text,
-                        translated_text=text,
-                        source_language=source_language,
-                        target_language=target_language,
-                        confidence_score=0.0,
-                    )
-                    results.append(fallback_result)
+            results = self.translate_many(texts, source_language, target_language)
 
             logger.info(f"Batch translated {len(results)} texts")
             return results
@@ -307,6 +520,33 @@ class TranslationService:
             logger.error(f"Error in batch translation: {e}")
             raise RuntimeError(f"Batch translation failed: {e}")
 
+    def translate_many(
+        self,
+        texts: List[str],
+        source_language: str = "auto",
+        target_language: str = "en",
+    ) -> List[TranslationResult]:
+        """
+        Translate texts one request each, sent concurrently on the worker pool
+
+        Args:
+            texts: List of texts to translate
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            List of TranslationResult objects in input order; texts that fail
+            keep their original text with a confidence score of 0.0
+        """
+        return list(
+            self._pool.map(
+                lambda text: self._safe_translate(
+                    text, source_language, target_language
+                ),
+                texts,
+            )
+        )
+
     def translate_with_fallback(
         self,
         text: str,
@@ -347,13 +587,24 @@ class TranslationService:
             # Additional fallback services can be implemented here
             raise RuntimeError(f"Translation failed with all methods: {e}")
 
+    def close(self) -> None:
+        """Shut down the translation worker threads"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
     def get_translation_stats(self) -> Dict[str, Any]:
         """Get translation service statistics"""
         return {
             "supported_languages": len(self.supported_languages),
             "max_text_length": self.max_text_length,
-            "service": "Google Translate",
+            "service": (
+                "MarianMT (local)"
+                if TRANSLATE_BACKEND == "marian"
+                else "Google Translate"
+            ),
             "features": ["auto_detection", "batch_translation", "fallback"],
+            "cache_size": len(self._cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
         }
 
 
@@ -2,12 +2,49 @@
 TTS Service - Wrapper around voice cloning functionality
 """
 
+import os
 import logging
-from typing import Dict, List, Optional
-from .voice_clone import synthesize_with_cloned_voice
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import numpy as np
+from .voice_clone import synthesize_with_cloned_voice, voice_clone_service
 
 logger = logging.getLogger(__name__)
 
+# Segments per synthesis batch, and the allowed longest/shortest length ratio
+BATCH_SIZE = 8
+BATCH_LENGTH_RATIO = 1.15
+
+_LANGS = MappingProxyType(
+    {
+        "en": "English",
+        "es": "Spanish",
+        "fr": "French",
+        "de": "German",
+        "it": "Italian",
+        "pt": "Portuguese",
+        "pl": "Polish",
+        "tr": "Turkish",
+        "ru": "Russian",
+        "nl": "Dutch",
+        "cs": "Czech",
+        "ar": "Arabic",
+        "zh-cn": "Chinese (Simplified)",
+        "ja": "Japanese",
+        "hu": "Hungarian",
+        "ko": "Korean",
+    }
+)
+
+_VOICES = (
+    "en-US-Wavenet-D",
+    "en-US-Wavenet-A",
+    "en-US-Wavenet-B",
+    "en-US-Wavenet-C",
+    "en-GB-Wavenet-A",
+    "en-GB-Wavenet-B",
+)
+
 
 class TTSService:
     """TTS Service using voice cloning model"""
@@ -34,6 +71,7 @@ class TTSService:
         pitch: float = 0.0,
         volume_gain_db: float = 0.0,
         reference_audio: Optional[str] = None,
+        language: str = "en",
     ) -> Dict:
         """
         Synthesize speech using voice cloning
@@ -46,27 +84,19 @@ class TTSService:
             pitch: Pitch adjustment
             volume_gain_db: Volume gain
             reference_audio: Reference audio for voice cloning
+            language: TTS language
 
         Returns:
             Result dictionary
         """
         try:
-            if reference_audio:
-                # Use voice cloning
-                result = synthesize_with_cloned_voice(
-                    text=text,
-                    reference_audio_path=reference_audio,
-                    output_path=output_path,
-                    language="en",
-                )
-            else:
-                # Use regular TTS from voice cloning model
-                result = synthesize_with_cloned_voice(
-                    text=text,
-                    reference_audio_path=None,
-                    output_path=output_path,
-                    language="en",
-                )
+            # Without reference audio this falls back to regular TTS
+            result = synthesize_with_cloned_voice(
+                text=text,
+                reference_audio_path=reference_audio,
+                output_path=output_path,
+                language=language,
+            )
 
             return {
                 "success": result.get("success", True),
@@ -78,74 +108,237 @@ class TTSService:
             logger.error(f"TTS synthesis failed: {e}")
             return {"success": False, "output_path": output_path, "error": str(e)}
 
-    def get_supported_languages(self) -> Dict[str, str]:
-        """Get supported languages"""
-        return {
-            "en": "English",
-            "es": "Spanish",
-            "fr": "French",
-            "de": "German",
-            "it": "Italian",
-            "pt": "Portuguese",
-            "pl": "Polish",
-            "tr": "Turkish",
-            "ru": "Russian",
-            "nl": "Dutch",
-            "cs": "Czech",
-            "ar": "Arabic",
-            "zh-cn": "Chinese (Simplified)",
-            "ja": "Japanese",
-            "hu": "Hungarian",
-            "ko": "Korean",
-        }
-
-    def get_supported_voices(self) -> List[str]:
+    def get_supported_languages(self) -> Mapping[str, str]:
+        """Get supported languages as a read-only mapping"""
+        return _LANGS
+
+    def get_supported_voices(self) -> Tuple[str, ...]:
         """Get supported voices"""
+        return _VOICES
+
+    def synthesize_speech_inmem(
+        self,
+        text: str,
+        reference_audio: Optional[str] = None,
+        language: str = "en",
+        speed: float = 1.0,
+    ) -> np.ndarray:
+        """
+        Synthesize speech into memory instead of a file
+
+        Args:
+            text: Text to synthesize
+            reference_audio: Reference audio for voice cloning
+            language: TTS language
+            speed: Speech speed
+
+        Returns:
+            float32 waveform at voice_clone_service.sample_rate
+        """
+        return voice_clone_service.synthesize(text, reference_audio, language, speed)
+
+    def _synthesize_one(
+        self,
+        text: str,
+        reference_audio: Optional[str],
+        language: str,
+        speed: float = 1.0,
+    ) -> Dict:
+        """Synthesize one text into memory, reporting failure in the result"""
+        try:
+            audio = self.synthesize_speech_inmem(text, reference_audio, language, speed)
+            return {"success": True, "audio": audio, "error": None}
+        except Exception as e:
+            logger.error(f"TTS synthesis failed: {e}")
+            return {"success": False, "audio": None, "error": str(e)}
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        reference_audio: str,
+        language: str,
+        output_paths: Optional[List[str]] = None,
+        speed: float = 1.0,
+        conditioning: Optional[Tuple] = None,
+    ) -> List[Dict]:
+        """
+        Synthesize several texts with the voice of one reference audio
+
+        Args:
+            texts: Texts to synthesize
+            reference_audio: Reference audio for voice cloning
+            language: TTS language
+            output_paths: Output audio file path for each text (None to keep
+                the audio in memory)
+            speed: Speech speed
+            conditioning: Precomputed speaker conditioning for reference_audio
+
+        Returns:
+            Result dictionary for each text, with the waveform under "audio"
+        """
+        try:
+            audios = voice_clone_service.synthesize_batch(
+                texts, reference_audio, language, speed, conditioning
+            )
+            results = [
+                {"success": True, "audio": audio, "error": None} for audio in audios
+            ]
+
+        except Exception as e:
+            logger.warning(f"Batch synthesis failed, synthesizing one by one: {e}")
+            results = [
+                self._synthesize_one(text, reference_audio, language, speed)
+                for text in texts
+            ]
+
+        if output_paths is not None:
+            for result, output_path in zip(results, output_paths):
+                result["output_path"] = (
+                    voice_clone_service.save_wav(result["audio"], output_path)
+                    if result["success"]
+                    else None
+                )
+
+        return results
+
+    def write_all(
+        self, audios: List[Optional[np.ndarray]], output_dir: str
+    ) -> List[Optional[str]]:
+        """
+        Write synthesized waveforms to tts_segment_{i}.wav files
+
+        Args:
+            audios: Waveforms to write (None entries are skipped)
+            output_dir: Output directory
+
+        Returns:
+            Path for each waveform, or None where it was skipped
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        prefix = os.path.join(output_dir, "tts_segment_")
+        save_wav = voice_clone_service.save_wav
+
         return [
-            "en-US-Wavenet-D",
-            "en-US-Wavenet-A",
-            "en-US-Wavenet-B",
-            "en-US-Wavenet-C",
-            "en-GB-Wavenet-A",
-            "en-GB-Wavenet-B",
+            save_wav(audio, prefix + str(i) + ".wav") if audio is not None else None
+            for i, audio in enumerate(audios)
         ]
 
+    @staticmethod
+    def _translation_text(translation: Any) -> str:
+        """Get the text to speak from a TranslationResult or dictionary"""
+        if hasattr(translation, "translated_text"):
+            return translation.translated_text
+        return translation.get("translated", translation.get("text", ""))
+
+    @staticmethod
+    def _length_buckets(texts: List[str]) -> List[List[int]]:
+        """
+        Group text indices into batches of similar length
+
+        Args:
+            texts: Texts to group
+
+        Returns:
+            Lists of indices into texts, shortest texts first
+        """
+        lengths = [max(len(text.split()), 1) for text in texts]
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+
+        buckets = []
+        bucket = []
+        for i in order:
+            if bucket and (
+                len(bucket) >= BATCH_SIZE
+                or lengths[i] / lengths[bucket[0]] >= BATCH_LENGTH_RATIO
+            ):
+                buckets.append(bucket)
+                bucket = []
+            bucket.append(i)
+        if bucket:
+            buckets.append(bucket)
+
+        return buckets
+
     def synthesize_translations(
-        self, translations: List[Dict], output_dir: str, **kwargs
+        self,
+        translations: List[Any],
+        output_dir: Optional[str] = None,
+        reference_audio: Optional[str] = None,
+        language: str = "en",
+        **kwargs,
     ) -> List[Dict]:
         """
         Synthesize multiple translations
 
+        The audio is kept in memory and only written to disk when an output
+        directory is given.
+
         Args:
-            translations: List of translation dictionaries
-            output_dir: Output directory
+            translations: List of TranslationResult objects or dictionaries
+            output_dir: Output directory (None to skip writing files)
+            reference_audio: Reference audio for voice cloning
+            language: TTS language
             **kwargs: Additional parameters
 
         Returns:
             List of synthesis results
         """
-        results = []
+        texts = [self._translation_text(translation) for translation in translations]
 
-        for i, translation in enumerate(translations):
-            output_path = f"{output_dir}/tts_segment_{i}.wav"
+        if reference_audio:
+            # Resolve the reference audio once for all segments
+            try:
+                conditioning = voice_clone_service.set_reference(reference_audio)
+            except Exception as e:
+                logger.error(f"Could not use reference audio {reference_audio}: {e}")
+                conditioning = None
 
-            result = self.synthesize_speech(
-                text=translation.get("translated", translation.get("text", "")),
-                output_path=output_path,
-                **kwargs,
-            )
+            # Batch segments of similar length, then restore the original order
+            jobs = self._length_buckets(texts)
 
-            results.append(
-                {
-                    "segment_id": i,
-                    "text": translation.get("translated", translation.get("text", "")),
-                    "output_path": output_path,
-                    "success": result["success"],
-                    "error": result.get("error"),
-                }
-            )
+            def synthesize(bucket):
+                return self.synthesize_batch(
+                    [texts[i] for i in bucket],
+                    reference_audio,
+                    language,
+                    conditioning=conditioning,
+                )
 
-        return results
+        else:
+            jobs = [[i] for i in range(len(texts))]
+
+            def synthesize(bucket):
+                return [self._synthesize_one(texts[bucket[0]], None, language)]
+
+        statuses = [None] * len(texts)
+        for bucket, bucket_statuses in zip(jobs, map(synthesize, jobs)):
+            for i, status in zip(bucket, bucket_statuses):
+                statuses[i] = status
+
+        audios = [status["audio"] for status in statuses]
+        output_paths = (
+            self.write_all(audios, output_dir) if output_dir else [None] * len(texts)
+        )
+        sample_rate = (
+            voice_clone_service.sample_rate
+            if any(status["success"] for status in statuses)
+            else None
+        )
+
+        return [
+            {
+                "segment_id": i,
+                "text": text,
+                "audio": audio,
+                "sample_rate": sample_rate,
+                "output_path": output_path,
+                "success": status["success"],
+                "error": status["error"],
+            }
+            for i, (text, audio, output_path, status) in enumerate(
+                zip(texts, audios, output_paths, statuses)
+            )
+        ]
 
 
 # Create singleton instance
@@ -3,46 +3,193 @@ Voice cloning service with TTS models and complete workflow integration
 """
 
 import os
+import re
+import time
+import queue
 import logging
-from TTS.api import TTS
-from googletrans import Translator
+import threading
+import contextlib
+import functools
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import numpy as np
+from decouple import config
 from .audio_extraction import audio_extraction_service
 from .whisper_transcribe import whisper_service
 from .translate import translation_service
+from ..models.schemas import VoiceCloneResult
+from ..utils.helpers import file_manager
+
+if TYPE_CHECKING:
+    from TTS.api import TTS
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize translator
-translator = Translator()
+# Write buffer size for synthesized audio files (1MB)
+OUTPUT_BUFFER_SIZE = 1 << 20
 
+XTTS_MODEL_NAME = "tts_models/multilingual/multi-dataset/xtts_v2"
 
-def translate_text(text, target_language="en", source_language="auto"):
+# Device for XTTS inference: "cuda", "cuda:N", "cpu", or empty to use CUDA
+# when available (the second GPU if there are two, leaving the first to Whisper)
+TTS_DEVICE = config("POLYVOX_TTS_DEVICE", default="").lower()
+
+try:
+    import torch
+
+    _CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    torch = None
+    _CUDA_AVAILABLE = False
+
+_DEVICE_GPU = _CUDA_AVAILABLE if not TTS_DEVICE else TTS_DEVICE.startswith("cuda")
+
+if TTS_DEVICE.startswith("cuda:"):
+    _CUDA_DEVICE = TTS_DEVICE
+elif TTS_DEVICE == "cuda":
+    _CUDA_DEVICE = "cuda:0"
+elif _CUDA_AVAILABLE and torch.cuda.device_count() > 1:
+    _CUDA_DEVICE = "cuda:1"
+else:
+    _CUDA_DEVICE = "cuda:0"
+
+# Run XTTS under float16 autocast on GPU. Roughly halves decoder memory
+# traffic at the cost of a slight, usually inaudible, loss of quality.
+TTS_FP16 = config("POLYVOX_TTS_FP16", default=False, cast=bool)
+
+# Fused DeepSpeed-Inference kernels for the XTTS GPT decoder on GPU. Needs the
+# optional deepspeed package and a CUDA toolkit (nvcc) matching the version
+# torch was built with, since the kernels are compiled on first use.
+TTS_DEEPSPEED = config("POLYVOX_USE_DEEPSPEED", default=False, cast=bool)
+
+try:
+    import deepspeed  # noqa: F401
+
+    _DEEPSPEED_AVAILABLE = True
+except ImportError:
+    _DEEPSPEED_AVAILABLE = False
+
+# Int8 weights for the XTTS GPT decoder, which is memory-bandwidth bound:
+# bitsandbytes LLM.int8() layers on GPU, dynamic quantization on CPU.
+TTS_INT8 = config("POLYVOX_TTS_INT8", default=False, cast=bool)
+
+try:
+    import bitsandbytes as bnb
+
+    _BNB_AVAILABLE = True
+except ImportError:
+    _BNB_AVAILABLE = False
+
+# TorchScript HiFi-GAN vocoder used for CPU inference when the file exists.
+# Created with VoiceCloneService.export_torchscript().
+TTS_TORCHSCRIPT_PATH = config("POLYVOX_TTS_TORCHSCRIPT", default="")
+
+# Longest text passed to one XTTS forward pass. Attention cost grows
+# quadratically with length, so longer texts are split at sentence boundaries.
+TTS_CHUNK_CHARS = 200
+
+# Crossfade between consecutive chunks of one text (0 to butt-join them)
+TTS_CROSSFADE_MS = 50
+
+# Reference audios whose speaker conditioning is kept in memory
+SPEAKER_CACHE_SIZE = 32
+
+_SENTENCE_RE = re.compile(r"[^.!?]+(?:[.!?]+|$)")
+
+
+def _split_sentences(text: str, max_chars: int = TTS_CHUNK_CHARS) -> List[str]:
     """
-    Translate text to target language
+    Split text at sentence boundaries into chunks of at most max_chars
+
+    Sentences longer than max_chars are split at the last space that fits.
 
     Args:
-        text: Text to translate
-        target_language: Target language code (e.g., 'en', 'fr', 'es')
-        source_language: Source language code or 'auto' for auto-detection
+        text: Text to split
+        max_chars: Maximum chunk length
 
     Returns:
-        dict: Translation result with original and translated text
+        List of text chunks
     """
-    try:
-        if not text or not text.strip():
-            return {
-                "original": text,
-                "translated": text,
-                "success": False,
-                "error": "Empty text",
-            }
+    pieces = []
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group().strip()
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            pieces.append(sentence)
+
+    chunks = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) + 1 + len(piece) <= max_chars:
+            chunks[-1] += " " + piece
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+def _crossfade_concat(
+    wavs: List[np.ndarray], sample_rate: int, fade_ms: int = TTS_CROSSFADE_MS
+) -> np.ndarray:
+    """
+    Concatenate waveforms, linearly crossfading each join
+
+    Args:
+        wavs: Waveforms to join
+        sample_rate: Sample rate of the waveforms
+        fade_ms: Crossfade length in milliseconds
+
+    Returns:
+        Joined float32 waveform
+    """
+    if not wavs:
+        return np.zeros(0, dtype=np.float32)
+
+    fade = int(sample_rate * fade_ms / 1000)
+    parts = []
+    tail = wavs[0]
+    for wav in wavs[1:]:
+        n = min(fade, len(tail), len(wav))
+        ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+        parts.append(tail[: len(tail) - n])
+        parts.append(tail[len(tail) - n :] * (1.0 - ramp) + wav[:n] * ramp)
+        tail = wav[n:]
+    parts.append(tail)
+
+    return np.concatenate(parts)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_translator():
+    """Create the googletrans translator on first use"""
+    from googletrans import Translator
+
+    return Translator()
+
+
+def _empty_translation(text):
+    """Translation result for text with nothing to translate"""
+    return {
+        "original": text,
+        "translated": text,
+        "success": False,
+        "error": "Empty text",
+    }
+
 
-        print(f"[INFO] Translating text from {source_language} to {target_language}...")
-        result = translator.translate(text, src=source_language, dest=target_language)
+def _translate_one(text, target_language, source_language):
+    """Translate a single string with googletrans"""
+    if not text or not text.strip():
+        return _empty_translation(text)
 
-        translation_result = {
+    try:
+        result = _get_translator().translate(
+            text, src=source_language, dest=target_language
+        )
+        return {
             "original": text,
             "translated": result.text,
             "source_language": result.src,
@@ -51,13 +198,9 @@ def translate_text(text, target_language="en", source_language="auto"):
             "error": None,
         }
 
-        print(f"[INFO] Translation completed: {result.text}")
-        return translation_result
-
     except Exception as e:
         error_msg = f"Translation failed: {e}"
         logger.error(error_msg)
-        print(f"[ERROR] {error_msg}")
         return {
             "original": text,
             "translated": text,
@@ -66,6 +209,54 @@ def translate_text(text, target_language="en", source_language="auto"):
         }
 
 
+def translate_text(text, target_language="en", source_language="auto"):
+    """
+    Translate text to target language
+
+    Args:
+        text: Text to translate, or a list of texts to translate concurrently
+        target_language: Target language code (e.g., 'en', 'fr', 'es')
+        source_language: Source language code or 'auto' for auto-detection
+
+    Returns:
+        dict: Translation result with original and translated text, or a list
+        of them when given a list
+    """
+    if not isinstance(text, list):
+        return _translate_one(text, target_language, source_language)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Translating {len(text)} text(s) from {source_language} to {target_language}"
+        )
+    # googletrans 4.0.0rc1 translates one string per request, so let the
+    # translation service send the requests side by side
+    items = [item for item in text if item and item.strip()]
+    translations = iter(
+        translation_service.translate_many(items, source_language, target_language)
+    )
+    results = []
+    for item in text:
+        if not item or not item.strip():
+            results.append(_empty_translation(item))
+            continue
+
+        result = next(translations)
+        # The service keeps the original text with a zero score on failure
+        success = result.confidence_score > 0.0
+        results.append(
+            {
+                "original": item,
+                "translated": result.translated_text,
+                "source_language": result.source_language,
+                "target_language": target_language,
+                "success": success,
+                "error": None if success else "Translation failed",
+            }
+        )
+    return results
+
+
 def synthesize_with_cloned_voice(
     text,
     reference_audio_path="reference_audio.wav",
@@ -73,6 +264,7 @@ def synthesize_with_cloned_voice(
     translate_to=None,
     source_language="auto",
     language="en",
+    speed=1.0,
 ):
     """
     Synthesize speech with cloned voice using Coqui XTTS
@@ -84,6 +276,7 @@ def synthesize_with_cloned_voice(
         translate_to: Target language code for translation (None for no translation)
         source_language: Source language code
         language: TTS language
+        speed: Speech speed
 
     Returns:
         dict: Result with success status and details
@@ -91,7 +284,7 @@ def synthesize_with_cloned_voice(
     try:
         if reference_audio_path and not os.path.exists(reference_audio_path):
             error_msg = f"Reference audio not found at: {reference_audio_path}"
-            print(f"[ERROR] {error_msg}")
+            logger.error(error_msg)
             return {"success": False, "error": error_msg}
 
         # Translate text if requested
@@ -103,33 +296,27 @@ def synthesize_with_cloned_voice(
             if translation_result["success"]:
                 final_text = translation_result["translated"]
             else:
-                print(
-                    f"[WARNING] Translation failed: {translation_result['error']}. Using original text."
+                logger.warning(
+                    f"Translation failed: {translation_result['error']}. Using original text."
                 )
 
-        print("[INFO] Loading XTTS voice cloning model...")
-
         try:
-            tts = TTS(
-                model_name="tts_models/multilingual/multi-dataset/xtts_v2",
-                progress_bar=True,
-                gpu=False,
-            )
+            voice_clone_service.warm_up()
         except Exception as e:
             error_msg = f"Failed to load XTTS model: {e}"
-            print(f"[ERROR] {error_msg}")
+            logger.error(error_msg)
             return {"success": False, "error": error_msg}
 
-        print("[INFO] Generating cloned speech using XTTS...")
-
-        tts.tts_to_file(
+        voice_clone_service.synthesize_to_file(
             text=final_text,
-            speaker_wav=reference_audio_path,
-            file_path=output_path,
+            output_path=output_path,
+            reference_audio_path=reference_audio_path,
             language=language,
+            speed=speed,
         )
 
-        print(f"[✅] Cloned voice saved at: {output_path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cloned voice saved at: {output_path}")
 
         return {
             "success": True,
@@ -143,7 +330,6 @@ def synthesize_with_cloned_voice(
     except Exception as e:
         error_msg = f"Voice cloning failed: {e}"
         logger.error(error_msg)
-        print(f"[ERROR] {error_msg}")
         return {"success": False, "error": error_msg}
 
 
@@ -152,22 +338,496 @@ class VoiceCloneService:
 
     def __init__(self):
         self.tts_model = None
+        self.gpu = _DEVICE_GPU
+        self.device = _CUDA_DEVICE if _DEVICE_GPU else "cpu"
+        self._models: Dict[bool, "TTS"] = {}
+        # XTTS inference is not re-entrant: GPT.compute_embeddings keeps each
+        # call's prefix on the shared model, so one inference runs per model
+        self._inference_locks: Dict[bool, threading.Lock] = {}
         self._initialized = False
+        self._load_lock = threading.Lock()
+
+        # Speaker conditioning per reference audio, least recently used first
+        self._conditioning: "OrderedDict[tuple, Tuple]" = OrderedDict()
+        self._conditioning_lock = threading.Lock()
+
+    def _get_model(self, gpu: Optional[bool] = None) -> "TTS":
+        """
+        Get the XTTS model for a device, loading it on first use
+
+        Args:
+            gpu: Whether to run on GPU (defaults to the service device)
+
+        Returns:
+            The loaded XTTS model
+        """
+        if gpu is None:
+            gpu = self.gpu
+
+        model = self._models.get(gpu)
+        if model is None:
+            with self._load_lock:
+                model = self._models.get(gpu)
+                if model is None:
+                    device = _CUDA_DEVICE if gpu else "cpu"
+                    logger.info(f"Loading XTTS voice cloning model on {device}...")
+                    start_time = time.time()
+                    from TTS.api import TTS
+
+                    model = TTS(model_name=XTTS_MODEL_NAME, progress_bar=False).to(
+                        device
+                    )
+                    if gpu:
+                        self._inject_deepspeed(model)
+                    else:
+                        self._load_torchscript(model)
+                    if TTS_INT8:
+                        self._quantize_int8(model, gpu)
+                    self._inference_locks[gpu] = threading.Lock()
+                    self._models[gpu] = model
+                    logger.info(f"XTTS model loaded in {time.time() - start_time:.1f}s")
+
+                    if gpu == self.gpu:
+                        self.tts_model = model
+                        self._initialized = True
+        return model
+
+    @staticmethod
+    def _inject_deepspeed(model: "TTS") -> None:
+        """Rebuild the GPT decoder with DeepSpeed fused kernels, if enabled"""
+        if not TTS_DEEPSPEED:
+            return
+        if not (_DEEPSPEED_AVAILABLE and _CUDA_AVAILABLE):
+            logger.warning("POLYVOX_USE_DEEPSPEED is set but DeepSpeed/CUDA is missing")
+            return
+
+        try:
+            xtts = model.synthesizer.tts_model
+            xtts.gpt.init_gpt_for_inference(
+                kv_cache=xtts.args.kv_cache, use_deepspeed=True
+            )
+            logger.info("XTTS GPT decoder using DeepSpeed-Inference kernels")
+        except Exception as e:
+            logger.warning(f"Could not enable DeepSpeed, using eager: {e}")
+
+    @staticmethod
+    def _quantize_int8(model: "TTS", gpu: bool) -> None:
+        """Replace the GPT decoder's linear layers with int8 ones"""
+        from torch import nn
+
+        if gpu and TTS_DEEPSPEED:
+            logger.warning("POLYVOX_TTS_INT8 is ignored with DeepSpeed kernels")
+            return
+        if gpu and not _BNB_AVAILABLE:
+            logger.warning("POLYVOX_TTS_INT8 is set but bitsandbytes is missing")
+            return
+
+        gpt = model.synthesizer.tts_model.gpt
+
+        def weight_bytes(module) -> int:
+            return sum(
+                t.numel() * t.element_size()
+                for t in list(module.parameters()) + list(module.buffers())
+            )
+
+        def to_int8(module) -> None:
+            for name, child in module.named_children():
+                # GPT-2 blocks use transformers' Conv1D, a Linear with the
+                # weight stored transposed
+                if type(child).__name__ == "Conv1D":
+                    linear = nn.Linear(child.weight.shape[0], child.nf)
+                    linear.weight.data = child.weight.data.t().contiguous()
+                    linear.bias.data = child.bias.data
+                    child = linear
+
+                if not isinstance(child, nn.Linear):
+                    to_int8(child)
+                    continue
+
+                if gpu:
+                    device = child.weight.device
+                    int8 = bnb.nn.Linear8bitLt(
+                        child.in_features,
+                        child.out_features,
+                        bias=child.bias is not None,
+                        has_fp16_weights=False,
+                        threshold=6.0,
+                    )
+                    int8.weight = bnb.nn.Int8Params(
+                        child.weight.data.cpu(),
+                        requires_grad=False,
+                        has_fp16_weights=False,
+                    )
+                    if child.bias is not None:
+                        int8.bias = nn.Parameter(
+                            child.bias.data.cpu(), requires_grad=False
+                        )
+                    # Weights are quantized when moved to the GPU
+                    child = int8.to(device)
+                else:
+                    child = torch.ao.quantization.quantize_dynamic(
+                        nn.Sequential(child), {nn.Linear}, dtype=torch.qint8
+                    )[0]
+                setattr(module, name, child)
+
+        try:
+            before = weight_bytes(gpt)
+            to_int8(gpt)
+            logger.info(
+                f"XTTS GPT decoder quantized to int8: {before / 2**20:.0f}MB -> "
+                f"{weight_bytes(gpt) / 2**20:.0f}MB of parameters"
+            )
+        except Exception as e:
+            logger.warning(f"Could not quantize XTTS to int8: {e}")
+
+    @staticmethod
+    def _load_torchscript(model: "TTS") -> None:
+        """Swap in the exported TorchScript vocoder, if there is one"""
+        if not TTS_TORCHSCRIPT_PATH or not os.path.exists(TTS_TORCHSCRIPT_PATH):
+            return
+
+        try:
+            decoder = model.synthesizer.tts_model.hifigan_decoder
+            decoder.waveform_decoder = torch.jit.load(
+                TTS_TORCHSCRIPT_PATH, map_location="cpu"
+            )
+            logger.info(f"Using TorchScript vocoder from {TTS_TORCHSCRIPT_PATH}")
+        except Exception as e:
+            logger.warning(f"Could not load TorchScript vocoder, using eager: {e}")
+
+    def export_torchscript(self, path: str = TTS_TORCHSCRIPT_PATH) -> str:
+        """
+        Trace the XTTS HiFi-GAN vocoder to TorchScript for CPU inference
+
+        The GPT decoder samples autoregressively through Hugging Face generate
+        and cannot be scripted, but the vocoder is a plain convolution stack
+        and traces with dynamic sequence length.
+
+        Args:
+            path: Output path for the TorchScript module
+
+        Returns:
+            Path to the saved module
+        """
+        if not path:
+            raise ValueError("No TorchScript output path given")
+
+        tts = self._get_model(gpu=False)
+        generator = tts.synthesizer.tts_model.hifigan_decoder.waveform_decoder
+        if isinstance(generator, torch.jit.ScriptModule):
+            generator.save(path)
+            return path
+
+        generator.eval()
+        latents = torch.randn(1, generator.conv_pre.in_channels, 32)
+        speaker = torch.randn(1, generator.cond_layer.in_channels, 1)
+
+        with torch.no_grad():
+            traced = torch.jit.trace(generator, (latents, speaker), check_trace=False)
+        traced = torch.jit.freeze(traced)
+        traced.save(path)
+
+        logger.info(f"Exported TorchScript vocoder to {path}")
+        return path
+
+    def warm_up(self) -> "TTS":
+        """
+        Load the XTTS model if it is not loaded yet
+
+        Safe to call repeatedly and from several threads; the model is only
+        loaded once.
+
+        Returns:
+            The loaded XTTS model
+        """
+        return self._get_model()
+
+    def _inference_lock(self, gpu: Optional[bool] = None) -> threading.Lock:
+        """Lock serializing inference on the model for a device"""
+        if gpu is None:
+            gpu = self.gpu
+        self._get_model(gpu)
+        return self._inference_locks[gpu]
+
+    def _autocast(self):
+        """Context for XTTS inference, using float16 autocast if enabled"""
+        if TTS_FP16 and self.gpu and torch is not None:
+            return torch.autocast(device_type="cuda", dtype=torch.float16)
+        return contextlib.nullcontext()
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the synthesized audio"""
+        return self._get_model().synthesizer.output_sample_rate
+
+    def synthesize(
+        self,
+        text: str,
+        reference_audio_path: Optional[str] = None,
+        language: str = "en",
+        speed: float = 1.0,
+    ) -> np.ndarray:
+        """
+        Render speech with the cached XTTS model
+
+        Args:
+            text: Text to synthesize
+            reference_audio_path: Reference audio for the voice
+            language: TTS language
+            speed: Speech speed
+
+        Returns:
+            float32 waveform at sample_rate
+        """
+        if reference_audio_path:
+            # Chunked, with one speaker conditioning for all chunks
+            return self.synthesize_batch([text], reference_audio_path, language, speed)[
+                0
+            ]
+
+        tts = self._get_model()
+
+        with self._inference_lock(), self._autocast():
+            wav = tts.tts(text=text, language=language, speed=speed)
+
+        return np.asarray(wav, dtype=np.float32)
+
+    def save_wav(self, wav: np.ndarray, output_path: str) -> str:
+        """
+        Save a synthesized waveform as WAV
+
+        Args:
+            wav: Waveform from synthesize()
+            output_path: Output file path
+
+        Returns:
+            Path to the saved audio file
+        """
+        # Write through a large buffer to keep the number of write calls low
+        with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            self._get_model().synthesizer.save_wav(wav=wav, path=f)
+        return output_path
+
+    def synthesize_to_file(
+        self,
+        text: str,
+        output_path: str,
+        reference_audio_path: Optional[str] = None,
+        language: str = "en",
+        speed: float = 1.0,
+    ) -> str:
+        """
+        Render speech with the cached XTTS model and save it as WAV
+
+        Args:
+            text: Text to synthesize
+            output_path: Output file path
+            reference_audio_path: Reference audio for the voice
+            language: TTS language
+            speed: Speech speed
+
+        Returns:
+            Path to the saved audio file
+        """
+        wav = self.synthesize(text, reference_audio_path, language, speed)
+        return self.save_wav(wav, output_path)
 
     def initialize(self):
         """Initialize the voice cloning service"""
         try:
-            # Service will be initialized on first use to avoid long startup times
-            self.tts_model = True  # Dummy for compatibility
-            self._initialized = True
+            self.warm_up()
             logger.info("Voice cloning service initialized")
         except Exception as e:
             logger.error(f"Failed to initialize voice cloning service: {e}")
             self._initialized = False
 
+    def _get_conditioning(self, reference_audio_path: str) -> Tuple:
+        """
+        Get the XTTS speaker conditioning for a reference audio
+
+        Computed once per file version and cached, keyed by path, mtime and
+        size so an overwritten reference is picked up.
+
+        Args:
+            reference_audio_path: Reference audio for the voice
+
+        Returns:
+            Tuple of the GPT conditioning latent and the speaker embedding
+        """
+        st = os.stat(reference_audio_path)
+        key = (
+            os.path.abspath(reference_audio_path),
+            st.st_mtime_ns,
+            st.st_size,
+            self.gpu,
+        )
+
+        with self._conditioning_lock:
+            conditioning = self._conditioning.get(key)
+            if conditioning is not None:
+                self._conditioning.move_to_end(key)
+                return conditioning
+
+        xtts = self._get_model().synthesizer.tts_model
+        with self._inference_lock(), self._autocast():
+            conditioning = xtts.get_conditioning_latents(
+                audio_path=[reference_audio_path]
+            )
+
+        with self._conditioning_lock:
+            self._conditioning[key] = conditioning
+            while len(self._conditioning) > SPEAKER_CACHE_SIZE:
+                self._conditioning.popitem(last=False)
+
+        return conditioning
+
+    def set_reference(self, reference_audio_path: str) -> Tuple:
+        """
+        Check a reference audio once and precompute its speaker conditioning
+
+        Pass the result to synthesize_batch() for every batch using this
+        reference, so no further file lookups are made for it.
+
+        Args:
+            reference_audio_path: Reference audio for the voice
+
+        Returns:
+            Speaker conditioning for the reference audio
+
+        Raises:
+            FileNotFoundError: If the reference audio does not exist
+        """
+        return self._get_conditioning(reference_audio_path)
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        reference_audio_path: str,
+        language: str = "en",
+        speed: float = 1.0,
+        conditioning: Optional[Tuple] = None,
+    ) -> List[np.ndarray]:
+        """
+        Render several texts in the voice of one reference audio
+
+        The speaker conditioning is cached per reference audio and reused for
+        every text, instead of being recomputed per text as tts() does. Long
+        texts are synthesized in sentence chunks of up to TTS_CHUNK_CHARS.
+
+        Args:
+            texts: Texts to synthesize
+            reference_audio_path: Reference audio for the voice
+            language: TTS language
+            speed: Speech speed
+            conditioning: Result of set_reference() for the reference audio,
+                to skip looking it up
+
+        Returns:
+            float32 waveform for each text, at sample_rate
+        """
+        xtts = self._get_model().synthesizer.tts_model
+        sample_rate = self.sample_rate
+        wavs = []
+
+        if conditioning is None:
+            conditioning = self._get_conditioning(reference_audio_path)
+        gpt_cond_latent, speaker_embedding = conditioning
+        lock = self._inference_lock()
+
+        for text in texts:
+            chunk_wavs = []
+            # Held per text, so concurrent callers take turns between texts
+            with lock, self._autocast():
+                for chunk in _split_sentences(text):
+                    out = xtts.inference(
+                        chunk,
+                        language,
+                        gpt_cond_latent,
+                        speaker_embedding,
+                        speed=speed,
+                    )
+                    chunk_wavs.append(np.asarray(out["wav"], dtype=np.float32))
+            wavs.append(_crossfade_concat(chunk_wavs, sample_rate))
+
+        return wavs
+
+    def synthesize_batch_to_files(
+        self,
+        texts: List[str],
+        output_paths: List[str],
+        reference_audio_path: str,
+        language: str = "en",
+        speed: float = 1.0,
+    ) -> List[str]:
+        """
+        Render several texts in the voice of one reference audio to WAV files
+
+        Args:
+            texts: Texts to synthesize
+            output_paths: Output file path for each text
+            reference_audio_path: Reference audio for the voice
+            language: TTS language
+            speed: Speech speed
+
+        Returns:
+            Paths to the saved audio files
+        """
+        wavs = self.synthesize_batch(texts, reference_audio_path, language, speed)
+        return [self.save_wav(wav, path) for wav, path in zip(wavs, output_paths)]
+
+    def clone_voice(
+        self,
+        text: str,
+        reference_audio_path: str,
+        target_language: str = "en",
+        speed: float = 1.0,
+    ) -> VoiceCloneResult:
+        """
+        Synthesize text with the voice of a reference audio
+
+        Args:
+            text: Text to synthesize
+            reference_audio_path: Path to reference audio file
+            target_language: TTS language
+            speed: Speech speed
+
+        Returns:
+            VoiceCloneResult with the generated WAV audio
+        """
+        start_time = time.time()
+        output_path = file_manager.create_temp_file(suffix=".wav")
+
+        try:
+            result = synthesize_with_cloned_voice(
+                text=text,
+                reference_audio_path=reference_audio_path,
+                output_path=output_path,
+                language=target_language,
+                speed=speed,
+            )
+
+            if not result["success"]:
+                raise RuntimeError(result["error"])
+
+            with open(output_path, "rb") as f:
+                audio_data = f.read()
+
+            return VoiceCloneResult(
+                cloned_audio_data=audio_data,
+                similarity_score=0.0,  # Not measured
+                processing_time=time.time() - start_time,
+                reference_audio_path=reference_audio_path,
+            )
+
+        finally:
+            file_manager.cleanup_file(output_path)
+
     def cleanup(self):
         """Cleanup resources"""
         try:
+            self._models.clear()
+            self._inference_locks.clear()
+            self._conditioning.clear()
             self.tts_model = None
             self._initialized = False
             logger.info("Voice cloning service cleaned up")
@@ -175,6 +835,167 @@ class VoiceCloneService:
             logger.error(f"Error during voice cloning cleanup: {e}")
 
 
+# Segments buffered between the stages of the workflow pipeline
+PIPELINE_QUEUE_SIZE = 4
+
+_STAGE_DONE = object()
+
+
+def _device_key(device: str) -> str:
+    """Normalize a torch device name, mapping cuda to cuda:0"""
+    return "cuda:0" if device == "cuda" else device
+
+
+def _drain(inbox: queue.Queue, limit: int) -> list:
+    """Block for one item from inbox, then take any others already waiting"""
+    items = [inbox.get()]
+    while len(items) < limit and items[-1] is not _STAGE_DONE:
+        try:
+            items.append(inbox.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
+
+def _transcribe_translate_synthesize(
+    audio_path, reference_audio_path, source_language, target_language
+):
+    """
+    Transcribe, translate and voice-clone audio as a pipeline of threads
+
+    Segments flow through bounded queues, so the translation requests for
+    later segments overlap with the synthesis of earlier ones.
+
+    Args:
+        audio_path: Path to the audio to transcribe
+        reference_audio_path: Reference audio for the voice
+        source_language: Source language code or 'auto' for auto-detection
+        target_language: Target language code
+
+    Returns:
+        dict: Transcription result, spoken texts, synthesized waveform,
+        translation confidences and translation error (if any)
+    """
+    segment_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    text_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    state = {
+        "transcription": None,
+        "texts": [],
+        "wavs": [],
+        "confidences": [],
+        "translation_error": None,
+        "error": None,
+    }
+
+    def transcribe():
+        try:
+            result = whisper_service.transcribe_audio(
+                audio_path=audio_path,
+                language=None if source_language == "auto" else source_language,
+            )
+            if not result.success:
+                raise RuntimeError(f"Transcription failed: {result.error_message}")
+
+            state["transcription"] = result
+
+            # Sharing one GPU with XTTS: hand Whisper's cached blocks back
+            # before synthesis needs the memory
+            if _CUDA_AVAILABLE and _device_key(whisper_service.device) == _device_key(
+                voice_clone_service.device
+            ):
+                torch.cuda.empty_cache()
+            for segment in result.segments:
+                segment_queue.put(segment)
+        except Exception as e:
+            state["error"] = state["error"] or e
+        finally:
+            segment_queue.put(_STAGE_DONE)
+
+    def translate():
+        # Keep consuming after a failure so the transcription stage never blocks
+        done = False
+        try:
+            while not done:
+                batch = _drain(segment_queue, PIPELINE_QUEUE_SIZE)
+                if batch[-1] is _STAGE_DONE:
+                    batch.pop()
+                    done = True
+
+                batch = [segment for segment in batch if segment.text.strip()]
+                if not batch or state["error"]:
+                    continue
+
+                texts = [segment.text for segment in batch]
+                detected_language = state["transcription"].detected_language
+                if (
+                    detected_language != target_language
+                    and not state["translation_error"]
+                ):
+                    try:
+                        results = translation_service.translate_segments(
+                            batch,
+                            source_language=detected_language or "auto",
+                            target_language=target_language,
+                        )
+                        texts = [result.translated_text for result in results]
+                        state["confidences"].extend(
+                            result.confidence_score for result in results
+                        )
+                    except Exception as e:
+                        # Speak the original text for the rest of the audio
+                        state["translation_error"] = e
+
+                for text in texts:
+                    text_queue.put(text)
+        finally:
+            text_queue.put(_STAGE_DONE)
+
+    def synthesize():
+        # Encode the reference voice while the transcription is still running
+        conditioning = None
+        try:
+            conditioning = voice_clone_service.set_reference(reference_audio_path)
+        except Exception as e:
+            state["error"] = state["error"] or e
+
+        while True:
+            text = text_queue.get()
+            if text is _STAGE_DONE:
+                break
+            if state["error"] or not text.strip():
+                continue
+
+            try:
+                state["wavs"].append(
+                    voice_clone_service.synthesize_batch(
+                        [text],
+                        reference_audio_path,
+                        target_language,
+                        conditioning=conditioning,
+                    )[0]
+                )
+                state["texts"].append(text)
+            except Exception as e:
+                state["error"] = state["error"] or e
+
+    threads = [
+        threading.Thread(target=stage, name=f"workflow-{stage.__name__}")
+        for stage in (transcribe, translate, synthesize)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if state["error"]:
+        raise state["error"]
+    if not state["wavs"]:
+        raise RuntimeError("No speech was transcribed to synthesize")
+
+    state["audio"] = np.concatenate(state.pop("wavs"))
+    return state
+
+
 def complete_video_to_voice_workflow(
     video_path,
     reference_audio_path,
@@ -211,16 +1032,13 @@ def complete_video_to_voice_workflow(
     }
 
     try:
-        print("🎬 STARTING COMPLETE VIDEO-TO-VOICE CLONING WORKFLOW")
-        print("=" * 60)
-        print(f"📹 Input Video: {video_path}")
-        print(f"🎤 Reference Audio: {reference_audio_path}")
-        print(f"🌍 Target Language: {target_language}")
-        print(f"🎵 Output: {output_path}")
-        print("=" * 60)
+        logger.info(
+            f"Starting video-to-voice workflow: {video_path} -> {output_path} "
+            f"({target_language}, reference {reference_audio_path})"
+        )
 
         # Step 1: Audio Extraction from Video
-        print("\n📹 STEP 1: Extracting audio from video...")
+        logger.info("Step 1: Extracting audio from video")
 
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
@@ -247,17 +1065,28 @@ def complete_video_to_voice_workflow(
         extracted_audio_path = extraction_result.audio_file_path
         workflow_result["temp_files"].append(extracted_audio_path)
 
-        print(f"✅ Audio extracted: {extracted_audio_path}")
-        print(f"   Duration: {extraction_result.duration:.2f}s")
+        logger.info(
+            f"Audio extracted: {extracted_audio_path} "
+            f"({extraction_result.duration:.2f}s)"
+        )
+
+        # Steps 2-4: Transcription, translation and voice cloning, pipelined
+        # per segment so later stages start before earlier ones finish
+        logger.info("Steps 2-4: Transcribing, translating and cloning voice")
 
-        # Step 2: Transcription of extracted audio
-        print("\n🎤 STEP 2: Transcribing audio to text...")
+        if not os.path.exists(reference_audio_path):
+            raise FileNotFoundError(
+                f"Reference audio not found at: {reference_audio_path}"
+            )
 
-        transcription_result = whisper_service.transcribe_audio(
-            audio_path=extracted_audio_path,
-            language=None if source_language == "auto" else source_language,
+        pipeline = _transcribe_translate_synthesize(
+            extracted_audio_path,
+            reference_audio_path,
+            source_language,
+            target_language,
         )
 
+        transcription_result = pipeline["transcription"]
         workflow_result["steps"]["transcription"] = {
             "success": True,
             "text": transcription_result.text,
@@ -268,83 +1097,67 @@ def complete_video_to_voice_workflow(
 
         transcribed_text = transcription_result.text
         detected_language = transcription_result.detected_language
+        final_text = " ".join(pipeline["texts"])
 
-        print(f"✅ Transcription completed")
-        print(f"   Detected Language: {detected_language}")
-        print(f"   Text: {transcribed_text}")
-
-        # Step 3: Translation of transcribed text
-        print(f"\n🌍 STEP 3: Translating text to {target_language}...")
-
-        final_text = transcribed_text
-        translation_result = None
-
-        # Only translate if target language differs from detected language
-        if detected_language != target_language:
-            try:
-                translation_result = translation_service.translate_text(
-                    text=transcribed_text,
-                    source_language=detected_language,
-                    target_language=target_language,
-                )
-
-                workflow_result["steps"]["translation"] = {
-                    "success": True,
-                    "original": transcribed_text,
-                    "translated": translation_result.translated_text,
-                    "source_language": translation_result.source_language,
-                    "target_language": translation_result.target_language,
-                    "confidence": translation_result.confidence_score,
-                }
-
-                final_text = translation_result.translated_text
-                print(f"✅ Translation completed")
-                print(f"   Original: {transcribed_text}")
-                print(f"   Translated: {final_text}")
+        logger.info(f"Transcription completed, detected language: {detected_language}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Transcribed text: {transcribed_text}")
 
-            except Exception as e:
-                print(f"⚠️ Translation failed: {e}")
-                print("   Using original transcribed text")
-                workflow_result["steps"]["translation"] = {
-                    "success": False,
-                    "error": str(e),
-                    "fallback": True,
-                }
-        else:
-            print(f"✅ No translation needed - detected language matches target")
+        if detected_language == target_language:
+            logger.info("No translation needed - detected language matches target")
             workflow_result["steps"]["translation"] = {
                 "success": True,
                 "skipped": True,
                 "reason": "Language match",
             }
+        elif pipeline["translation_error"]:
+            logger.warning(
+                f"Translation failed: {pipeline['translation_error']}. "
+                "Using original transcribed text."
+            )
+            workflow_result["steps"]["translation"] = {
+                "success": False,
+                "error": str(pipeline["translation_error"]),
+                "fallback": True,
+            }
+        else:
+            confidences = pipeline["confidences"]
+            workflow_result["steps"]["translation"] = {
+                "success": True,
+                "original": transcribed_text,
+                "translated": final_text,
+                "source_language": detected_language,
+                "target_language": target_language,
+                "confidence": (
+                    sum(confidences) / len(confidences) if confidences else 0.0
+                ),
+            }
+            logger.info("Translation completed")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Translated text: {final_text}")
 
-        # Step 4: Voice cloning with reference audio and translated text
-        print(f"\n🗣️ STEP 4: Cloning voice with reference audio...")
-
-        cloning_result = synthesize_with_cloned_voice(
-            text=final_text,
-            reference_audio_path=reference_audio_path,
-            output_path=output_path,
-            language=target_language,
-        )
-
-        workflow_result["steps"]["voice_cloning"] = cloning_result
+        voice_clone_service.save_wav(pipeline["audio"], output_path)
 
-        if not cloning_result["success"]:
-            raise RuntimeError(f"Voice cloning failed: {cloning_result['error']}")
+        workflow_result["steps"]["voice_cloning"] = {
+            "success": True,
+            "original_text": transcribed_text,
+            "final_text": final_text,
+            "output_path": output_path,
+            "was_translated": detected_language != target_language,
+            "translation_result": None,
+        }
 
-        print(f"✅ Voice cloning completed: {output_path}")
+        logger.info(f"Voice cloning completed: {output_path}")
 
         # Cleanup temporary files if requested
         if cleanup_temp_files:
-            print(f"\n🧹 Cleaning up temporary files...")
             for temp_file in workflow_result["temp_files"]:
                 try:
                     if os.path.exists(temp_file):
                         os.remove(temp_file)
-                        print(f"   Deleted: {temp_file}")
+                        logger.debug(f"Deleted temporary file: {temp_file}")
                 except Exception as e:
-                    print(f"   Warning: Could not delete {temp_file}: {e}")
+                    logger.warning(f"Could not delete {temp_file}: {e}")
 
         # Success!
         workflow_result.update(
@@ -359,19 +1172,13 @@ def complete_video_to_voice_workflow(
             }
         )
 
-        print(f"\n🎉 WORKFLOW COMPLETED SUCCESSFULLY!")
-        print(f"📁 Input Video: {video_path}")
-        print(f"📄 Transcribed: {transcribed_text}")
-        if workflow_result["was_translated"]:
-            print(f"📄 Translated: {final_text}")
-        print(f"🎵 Final Output: {output_path}")
+        logger.info(f"Workflow completed: {video_path} -> {output_path}")
 
         return workflow_result
 
     except Exception as e:
         error_msg = f"Workflow failed: {e}"
         logger.error(error_msg)
-        print(f"\n❌ {error_msg}")
 
         workflow_result.update(
             {
@@ -1,13 +1,289 @@
 import os
+import contextlib
+import functools
+import subprocess
+import json
+import hashlib
+import tempfile
 import logging
+import threading
+from types import MappingProxyType
 import whisper
 import torch
-from typing import Optional, Dict, Any, List
+from decouple import config
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, Union
+import numpy as np
+from whisper.audio import SAMPLE_RATE
 from ..models.schemas import TranscriptionResult, TranscriptionSegment
-from ..utils.helpers import ErrorHandler, file_manager
+from ..utils.helpers import (
+    AudioUtils,
+    ErrorHandler,
+    file_manager,
+    generate_file_hash,
+)
 
 logger = logging.getLogger(__name__)
 
+# Device for Whisper inference. Defaults to the first GPU, so XTTS can take
+# the second one on multi-GPU machines.
+WHISPER_DEVICE = config(
+    "POLYVOX_WHISPER_DEVICE",
+    default="cuda:0" if torch.cuda.is_available() else "cpu",
+)
+
+# Inference backend: "openai" (PyTorch Whisper) or "faster" (faster-whisper,
+# CTranslate2 with int8 weights)
+WHISPER_BACKEND = config("POLYVOX_WHISPER_BACKEND", default="openai").lower()
+
+# Compile the PyTorch Whisper encoder with torch.compile (CUDA only)
+WHISPER_COMPILE = config("POLYVOX_WHISPER_COMPILE", default=False, cast=bool)
+
+# Audio windows transcribed concurrently by the faster-whisper backend
+WHISPER_WORKERS = config("POLYVOX_WHISPER_WORKERS", default=4, cast=int)
+
+# Split long audio on Silero VAD speech regions instead of fixed windows
+WHISPER_VAD = config("POLYVOX_WHISPER_VAD", default=True, cast=bool)
+
+# Files whose language is detected in one encoder pass
+DETECT_BATCH_SIZE = config("POLYVOX_DETECT_BATCH_SIZE", default=8, cast=int)
+
+# Decoded audio arrays kept in memory, most recently used first. Off by
+# default: the API spools every upload to a fresh path, so it would never
+# hit and would only pin the last file's samples in memory.
+AUDIO_CACHE_SIZE = config("POLYVOX_AUDIO_CACHE_SIZE", default=0, cast=int)
+
+# On-disk cache of transcriptions keyed by audio content and options
+TRANSCRIPT_CACHE_SIZE = config("POLYVOX_TRANSCRIPT_CACHE_SIZE", default=256, cast=int)
+TRANSCRIPT_CACHE_DIR = file_manager.base_dir / "cache" / "transcripts"
+
+
+@functools.lru_cache(maxsize=AUDIO_CACHE_SIZE)
+def _decode_cached(path: str, mtime_ns: int, size: int) -> np.ndarray:
+    """Decode a file with one ffmpeg process, reusing it until the file changes"""
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads",
+        "0",
+        "-i",
+        path,
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-",
+    ]
+    try:
+        raw = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio: {e.stderr.decode()}") from e
+
+    # One float32 allocation, scaled in place
+    audio = np.frombuffer(raw, np.int16).astype(np.float32)
+    audio *= 1.0 / 32768.0
+    return audio
+
+
+def decode_audio(path: str) -> np.ndarray:
+    """
+    Decode an audio file to 16 kHz mono float32 samples
+
+    Args:
+        path: Path to the audio or video file
+
+    Returns:
+        Samples in [-1, 1); shared with later calls, so do not modify them
+    """
+    stat = os.stat(path)
+    return _decode_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _options_template(
+    beam_size: Optional[int],
+    best_of: Optional[int],
+    patience: Optional[float],
+    word_timestamps: bool,
+) -> MappingProxyType:
+    """Transcribe options fixed by the decoding settings, built once per combo"""
+    options = {"word_timestamps": word_timestamps}
+    if beam_size is not None:
+        options["beam_size"] = beam_size
+    if best_of is not None:
+        options["best_of"] = best_of
+    if patience is not None:
+        options["patience"] = patience
+    return MappingProxyType(options)
+
+
+# Languages Whisper can transcribe, with a set for membership checks
+_LANGUAGES = (
+    "en",
+    "zh",
+    "de",
+    "es",
+    "ru",
+    "ko",
+    "fr",
+    "ja",
+    "pt",
+    "tr",
+    "pl",
+    "ca",
+    "nl",
+    "ar",
+    "sv",
+    "it",
+    "id",
+    "hi",
+    "fi",
+    "vi",
+    "he",
+    "uk",
+    "el",
+    "ms",
+    "cs",
+    "ro",
+    "da",
+    "hu",
+    "ta",
+    "no",
+    "th",
+    "ur",
+    "hr",
+    "bg",
+    "lt",
+    "la",
+    "mi",
+    "ml",
+    "cy",
+    "sk",
+    "te",
+    "fa",
+    "lv",
+    "bn",
+    "sr",
+    "az",
+    "sl",
+    "kn",
+    "et",
+    "mk",
+    "br",
+    "eu",
+    "is",
+    "hy",
+    "ne",
+    "mn",
+    "bs",
+    "kk",
+    "sq",
+    "sw",
+    "gl",
+    "mr",
+    "pa",
+    "si",
+    "km",
+    "sn",
+    "yo",
+    "so",
+    "af",
+    "oc",
+    "ka",
+    "be",
+    "tg",
+    "sd",
+    "gu",
+    "am",
+    "yi",
+    "lo",
+    "uz",
+    "fo",
+    "ht",
+    "ps",
+    "tk",
+    "nn",
+    "mt",
+    "sa",
+    "lb",
+    "my",
+    "bo",
+    "tl",
+    "mg",
+    "as",
+    "tt",
+    "haw",
+    "ln",
+    "ha",
+    "ba",
+    "jw",
+    "su",
+)
+_LANGUAGE_SET = frozenset(_LANGUAGES)
+
+
+class TranscriptionColumns(NamedTuple):
+    """Segments of one Whisper result held as parallel columns"""
+
+    start_time: np.ndarray
+    end_time: np.ndarray
+    confidence: np.ndarray
+    text: List[str]
+    language: Optional[str]
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "TranscriptionColumns":
+        """Build columns from a whisper-style transcribe result"""
+        raw = result["segments"]
+        n = len(raw)
+        return cls(
+            start_time=np.fromiter((seg["start"] for seg in raw), np.float64, n),
+            end_time=np.fromiter((seg["end"] for seg in raw), np.float64, n),
+            confidence=np.fromiter(
+                (seg.get("avg_logprob", 0.0) for seg in raw), np.float32, n
+            ),
+            text=[seg["text"].strip() for seg in raw],
+            language=result.get("language"),
+        )
+
+    def to_segments(
+        self, time_offset: float = 0.0, first_id: int = 0
+    ) -> List[TranscriptionSegment]:
+        """
+        Materialize TranscriptionSegment rows
+
+        The columns already hold plain floats and strings, so rows are built
+        with model_construct and skip pydantic validation.
+
+        Args:
+            time_offset: Seconds added to every timestamp
+            first_id: Id of the first segment
+
+        Returns:
+            List of segments in order
+        """
+        rows = zip(
+            (self.start_time + time_offset).tolist(),
+            (self.end_time + time_offset).tolist(),
+            self.confidence.tolist(),
+            self.text,
+        )
+        return [
+            TranscriptionSegment.model_construct(
+                id=i,
+                start_time=start,
+                end_time=end,
+                text=text,
+                confidence=confidence,
+                language=self.language,
+            )
+            for i, (start, end, confidence, text) in enumerate(rows, first_id)
+        ]
+
 
 class WhisperTranscriptionService:
     """Service for speech-to-text transcription using OpenAI Whisper"""
@@ -15,108 +291,25 @@ class WhisperTranscriptionService:
     def __init__(self):
         self.model = None
         self.model_size = "base"  # Default model size
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.supported_languages = [
-            "en",
-            "zh",
-            "de",
-            "es",
-            "ru",
-            "ko",
-            "fr",
-            "ja",
-            "pt",
-            "tr",
-            "pl",
-            "ca",
-            "nl",
-            "ar",
-            "sv",
-            "it",
-            "id",
-            "hi",
-            "fi",
-            "vi",
-            "he",
-            "uk",
-            "el",
-            "ms",
-            "cs",
-            "ro",
-            "da",
-            "hu",
-            "ta",
-            "no",
-            "th",
-            "ur",
-            "hr",
-            "bg",
-            "lt",
-            "la",
-            "mi",
-            "ml",
-            "cy",
-            "sk",
-            "te",
-            "fa",
-            "lv",
-            "bn",
-            "sr",
-            "az",
-            "sl",
-            "kn",
-            "et",
-            "mk",
-            "br",
-            "eu",
-            "is",
-            "hy",
-            "ne",
-            "mn",
-            "bs",
-            "kk",
-            "sq",
-            "sw",
-            "gl",
-            "mr",
-            "pa",
-            "si",
-            "km",
-            "sn",
-            "yo",
-            "so",
-            "af",
-            "oc",
-            "ka",
-            "be",
-            "tg",
-            "sd",
-            "gu",
-            "am",
-            "yi",
-            "lo",
-            "uz",
-            "fo",
-            "ht",
-            "ps",
-            "tk",
-            "nn",
-            "mt",
-            "sa",
-            "lb",
-            "my",
-            "bo",
-            "tl",
-            "mg",
-            "as",
-            "tt",
-            "haw",
-            "ln",
-            "ha",
-            "ba",
-            "jw",
-            "su",
-        ]
+        self.device = WHISPER_DEVICE
+        self.backend = WHISPER_BACKEND
+
+        # openai-whisper hooks its KV cache onto the shared decoder for each
+        # decode, so inference runs one call at a time. The lock also covers
+        # loading, so a request for another size can't swap a model in use.
+        self._model_lock = threading.RLock()
+
+        # Reused host (pinned on CUDA) / device buffers for 30 s audio windows
+        self._audio_host = None
+        self._audio_device = None
+        self._audio_copied = None
+        self._audio_lock = threading.Lock()
+
+        # Silero VAD model and helpers, loaded on first long transcription
+        self._vad = None
+        self._vad_lock = threading.Lock()
+
+        self.supported_languages = _LANGUAGES
         self.model_sizes = [
             "tiny",
             "base",
@@ -133,18 +326,139 @@ class WhisperTranscriptionService:
             if model_size not in self.model_sizes:
                 raise ValueError(f"Invalid model size. Choose from: {self.model_sizes}")
 
-            logger.info(f"Loading Whisper model: {model_size} on device: {self.device}")
-            self.model = whisper.load_model(model_size, device=self.device)
-            self.model_size = model_size
+            with self._model_lock:
+                logger.info(
+                    f"Loading Whisper model: {model_size} on device: {self.device}"
+                )
+                if self.backend == "faster":
+                    self.model = self._load_faster_model(model_size)
+                else:
+                    self.model = whisper.load_model(model_size, device=self.device)
+                    if WHISPER_COMPILE and self.device.startswith("cuda"):
+                        self._compile_encoder()
+                self.model_size = model_size
             logger.info(f"Whisper model {model_size} loaded successfully")
 
         except Exception as e:
             logger.error(f"Error loading Whisper model: {e}")
             raise RuntimeError(f"Failed to load Whisper model: {e}")
 
+    @contextlib.contextmanager
+    def _model_session(self, model_size: Optional[str] = None):
+        """
+        Load the requested model size if needed and hold it for inference
+
+        For openai-whisper, _model_lock is held until the block exits. The
+        thread-safe faster-whisper backend only holds it while loading.
+
+        Args:
+            model_size: Whisper model size (None for whichever is loaded)
+        """
+        with self._model_lock:
+            if self.model is None or (
+                model_size is not None and self.model_size != model_size
+            ):
+                self.load_model(model_size or self.model_size)
+            if self.backend != "faster":
+                yield
+                return
+        yield
+
+    def _compile_encoder(self) -> None:
+        """
+        Compile the audio encoder and warm it up
+
+        Only the encoder is compiled: the decoder gets KV-cache forward hooks
+        installed and removed on every decode, which would invalidate a
+        compiled decoder's guards and recompile it each call.
+        """
+        logger.info("Compiling Whisper encoder")
+        self.model.encoder = torch.compile(self.model.encoder, fullgraph=True)
+
+        # Trigger compilation now rather than on the first request
+        with torch.inference_mode():
+            self.model.transcribe(np.zeros(whisper.audio.N_SAMPLES, np.float32))
+        logger.info("Whisper encoder compiled")
+
+    def _load_faster_model(self, model_size: str):
+        """Load a faster-whisper model with int8 weights"""
+        from faster_whisper import WhisperModel
+
+        device, _, index = self.device.partition(":")
+        return WhisperModel(
+            model_size,
+            device=device,
+            device_index=int(index or 0),
+            compute_type="int8_float16" if device == "cuda" else "int8",
+            # Split the cores between the concurrent workers
+            cpu_threads=max(1, (os.cpu_count() or 1) // max(1, WHISPER_WORKERS)),
+            num_workers=max(1, WHISPER_WORKERS),
+        )
+
+    def _transcribe_faster(self, audio_path: str, **options) -> Dict[str, Any]:
+        """
+        Transcribe with faster-whisper, returning openai-whisper's result shape
+
+        Args:
+            audio_path: Path to the audio file
+            **options: openai-whisper transcription options
+
+        Returns:
+            Dictionary with "segments" and "language" like whisper's transcribe
+        """
+        options.setdefault("beam_size", 1)  # Greedy, as openai-whisper defaults
+        segments, info = self.model.transcribe(audio_path, **options)
+
+        return {
+            "segments": [
+                {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text,
+                    "avg_logprob": segment.avg_logprob,
+                }
+                for segment in segments
+            ],
+            "language": info.language,
+        }
+
+    def _build_options(
+        self,
+        language: Optional[str] = None,
+        temperature: float = 0.0,
+        beam_size: Optional[int] = None,
+        best_of: Optional[int] = None,
+        patience: Optional[float] = None,
+        word_timestamps: bool = False,
+        initial_prompt: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build Whisper transcribe options, dropping unsupported languages"""
+        # Validate language code
+        if language and language not in _LANGUAGE_SET:
+            logger.warning(f"Language {language} not supported. Using auto-detection.")
+            language = None
+
+        # Copy the shared template and fill in the per-call options
+        options = _options_template(beam_size, best_of, patience, word_timestamps)
+        return {
+            **options,
+            "language": language,
+            "temperature": temperature,
+            "initial_prompt": initial_prompt,
+        }
+
+    def _run_model(
+        self, audio: Union[str, np.ndarray], options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run the loaded model, returning openai-whisper's result shape"""
+        if self.backend == "faster":
+            return self._transcribe_faster(audio, **options)
+        with torch.inference_mode():
+            return self.model.transcribe(audio, **options)
+
     def transcribe_audio(
         self,
-        audio_path: str,
+        audio_path: Union[str, np.ndarray],
         language: Optional[str] = None,
         model_size: str = "base",
         temperature: float = 0.0,
@@ -158,7 +472,7 @@ class WhisperTranscriptionService:
         Transcribe audio file using Whisper
 
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or 16 kHz mono float32 samples
             language: Language code for transcription (auto-detect if None)
             model_size: Whisper model size to use
             temperature: Temperature for sampling
@@ -173,63 +487,56 @@ class WhisperTranscriptionService:
         """
         try:
             # Validate input file
-            if not os.path.exists(audio_path):
+            is_path = isinstance(audio_path, str)
+            if is_path and not os.path.exists(audio_path):
                 raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-            # Load model if not already loaded or if different size requested
-            if self.model is None or self.model_size != model_size:
-                self.load_model(model_size)
+            options = self._build_options(
+                language,
+                temperature,
+                beam_size,
+                best_of,
+                patience,
+                word_timestamps,
+                initial_prompt,
+            )
 
-            # Validate language code
-            if language and language not in self.supported_languages:
-                logger.warning(
-                    f"Language {language} not supported. Using auto-detection."
-                )
-                language = None
-
-            # Prepare transcription options
-            options = {
-                "language": language,
-                "temperature": temperature,
-                "word_timestamps": word_timestamps,
-                "initial_prompt": initial_prompt,
-            }
-
-            # Add optional parameters
-            if beam_size is not None:
-                options["beam_size"] = beam_size
-            if best_of is not None:
-                options["best_of"] = best_of
-            if patience is not None:
-                options["patience"] = patience
+            # Repeated requests for the same file are served from disk
+            cache_key = None
+            if is_path and TRANSCRIPT_CACHE_SIZE > 0:
+                cache_key = self._cache_key(audio_path, model_size, options)
+                cached = self._load_cached(cache_key)
+                if cached is not None:
+                    logger.info(f"Using cached transcription for {audio_path}")
+                    return cached
 
             # Perform transcription
-            logger.info(f"Transcribing audio: {audio_path}")
-            result = self.model.transcribe(audio_path, **options)
+            if is_path:
+                logger.info(f"Transcribing audio: {audio_path}")
+            else:
+                logger.info(
+                    f"Transcribing {len(audio_path) / SAMPLE_RATE:.1f}s of audio samples"
+                )
+            audio = decode_audio(audio_path) if is_path else audio_path
+
+            # Load model if not already loaded or if different size requested
+            with self._model_session(model_size):
+                result = self._run_model(audio, options)
 
             # Process results
-            segments = []
-            for i, segment in enumerate(result["segments"]):
-                transcription_segment = TranscriptionSegment(
-                    id=i,
-                    start_time=segment["start"],
-                    end_time=segment["end"],
-                    text=segment["text"].strip(),
-                    confidence=segment.get("avg_logprob", 0.0),
-                    language=result.get("language"),
-                )
-                segments.append(transcription_segment)
+            columns = TranscriptionColumns.from_result(result)
+            segments = columns.to_segments()
 
             # Calculate overall confidence score
-            confidence_score = self._calculate_confidence_score(result["segments"])
+            confidence_score = self._calculate_confidence_score(columns.confidence)
 
             # Combine all segment texts
-            full_text = " ".join([seg.text for seg in segments])
+            full_text = " ".join(columns.text)
 
             transcription_result = TranscriptionResult(
                 segments=segments,
                 detected_language=result.get("language"),
-                total_duration=segments[-1].end_time if segments else 0.0,
+                total_duration=float(columns.end_time[-1]) if segments else 0.0,
                 confidence_score=confidence_score,
                 success=True,
                 error_message=None,
@@ -242,6 +549,9 @@ class WhisperTranscriptionService:
                 f"Segments: {len(segments)}, Confidence: {confidence_score:.2f}"
             )
 
+            if cache_key is not None:
+                self._store_cached(cache_key, transcription_result)
+
             return transcription_result
 
         except Exception as e:
@@ -257,6 +567,115 @@ class WhisperTranscriptionService:
                 language=None,
             )
 
+    def _cache_key(
+        self, audio_path: str, model_size: str, options: Dict[str, Any]
+    ) -> str:
+        """Build a transcription cache key from file contents and options"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(generate_file_hash(audio_path).encode())
+        h.update(
+            json.dumps(
+                {"backend": self.backend, "model_size": model_size, **options},
+                sort_keys=True,
+            ).encode()
+        )
+        return h.hexdigest()
+
+    def _load_cached(self, key: str) -> Optional[TranscriptionResult]:
+        """Load a cached transcription, marking it as recently used"""
+        path = TRANSCRIPT_CACHE_DIR / f"{key}.json"
+        try:
+            result = TranscriptionResult.model_validate_json(path.read_bytes())
+            os.utime(path)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable transcription cache entry {key}: {e}")
+            return None
+
+    def _store_cached(self, key: str, result: TranscriptionResult) -> None:
+        """Write a transcription to the cache and evict least recently used"""
+        try:
+            TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temp file and rename, so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=TRANSCRIPT_CACHE_DIR)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(result.model_dump_json().encode())
+                os.replace(tmp_path, TRANSCRIPT_CACHE_DIR / f"{key}.json")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            entries = sorted(
+                TRANSCRIPT_CACHE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime
+            )
+            for stale in entries[: max(0, len(entries) - TRANSCRIPT_CACHE_SIZE)]:
+                stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not cache transcription {key}: {e}")
+
+    def _get_vad(self) -> Tuple[Any, Any]:
+        """Load the Silero VAD model and its helper functions on first use"""
+        if self._vad is None:
+            with self._vad_lock:
+                if self._vad is None:
+                    logger.info("Loading Silero VAD model")
+                    self._vad = torch.hub.load("snakers4/silero-vad", "silero_vad")
+        return self._vad
+
+    def _vad_segments(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        """Return (start, end) sample offsets of the speech regions in audio"""
+        vad_model, utils = self._get_vad()
+        get_speech_timestamps = utils[0]
+
+        # The VAD model keeps recurrent state between calls
+        with self._vad_lock:
+            timestamps = get_speech_timestamps(
+                torch.from_numpy(audio), vad_model, sampling_rate=SAMPLE_RATE
+            )
+        return [(ts["start"], ts["end"]) for ts in timestamps]
+
+    def _speech_windows(self, audio: np.ndarray, window: int) -> List[Tuple[int, int]]:
+        """
+        Group speech regions into (start, end) spans of at most window samples
+
+        Silence between spans is skipped and regions longer than a window are
+        split. Falls back to fixed windows over the whole audio when VAD is
+        disabled or unavailable.
+
+        Args:
+            audio: 16 kHz mono float32 audio
+            window: Maximum span length in samples
+
+        Returns:
+            List of (start, end) sample offsets in order
+        """
+        fixed = [
+            (start, min(start + window, len(audio)))
+            for start in range(0, len(audio), window)
+        ]
+        if not WHISPER_VAD:
+            return fixed
+
+        try:
+            regions = self._vad_segments(audio)
+        except Exception as e:
+            logger.warning(f"Voice activity detection failed, using fixed windows: {e}")
+            return fixed
+
+        spans = []
+        for start, end in regions:
+            # Extend the current span while the region still fits in it
+            if spans and end - spans[-1][0] <= window:
+                spans[-1] = (spans[-1][0], end)
+                continue
+            for split in range(start, end, window):
+                spans.append((split, min(split + window, end)))
+        return spans
+
     def transcribe_with_segments(
         self,
         audio_path: str,
@@ -277,60 +696,65 @@ class WhisperTranscriptionService:
             TranscriptionResult with combined transcription segments
         """
         try:
-            # Load model if needed
-            if self.model is None or self.model_size != model_size:
-                self.load_model(model_size)
-
-            # Get audio duration
-            from pydub import AudioSegment
+            # Read the duration from container metadata; short files are
+            # transcribed straight from their path, which also hits the cache
+            if 0.0 < AudioUtils.get_audio_duration(audio_path) <= segment_duration:
+                return self.transcribe_audio(audio_path, language, model_size)
 
-            audio = AudioSegment.from_file(audio_path)
-            total_duration = len(audio) / 1000.0  # Convert to seconds
+            # Decode once with ffmpeg to 16 kHz mono float32, then transcribe
+            # slices of the array without re-encoding or touching disk
+            audio = decode_audio(audio_path)
+            total_duration = len(audio) / SAMPLE_RATE
 
             # If audio is short, transcribe normally
             if total_duration <= segment_duration:
-                return self.transcribe_audio(audio_path, language, model_size)
-
-            # Split audio into segments
-            segments = []
-            segment_count = int(total_duration / segment_duration) + 1
-
-            logger.info(f"Transcribing audio in {segment_count} segments")
-
-            for i in range(segment_count):
-                start_time = i * segment_duration * 1000  # Convert to milliseconds
-                end_time = min((i + 1) * segment_duration * 1000, len(audio))
+                return self.transcribe_audio(audio, language, model_size)
 
-                # Extract segment
-                segment_audio = audio[start_time:end_time]
+            # Split audio into speech spans of at most segment_duration
+            window = int(segment_duration * SAMPLE_RATE)
+            spans = self._speech_windows(audio, window)
+            options = self._build_options(language)
 
-                # Save segment to temporary file
-                temp_path = file_manager.create_temp_file(suffix=".wav")
-                segment_audio.export(temp_path, format="wav")
+            logger.info(f"Transcribing audio in {len(spans)} segments")
 
+            def transcribe_window(span: Tuple[int, int]) -> TranscriptionColumns:
+                # Transcribe a view into the decoded audio
+                start, end = span
                 try:
-                    # Transcribe segment
-                    segment_result = self.transcribe_audio(
-                        temp_path, language, model_size
+                    result = self._run_model(audio[start:end], options)
+                except Exception as e:
+                    logger.error(
+                        f"Error transcribing audio at {start / SAMPLE_RATE:.1f}s: {e}"
                     )
-
-                    # Adjust timestamps
-                    time_offset = i * segment_duration
-                    for seg in segment_result.segments:
-                        seg.start_time += time_offset
-                        seg.end_time += time_offset
-                        seg.id = len(segments)
-                        segments.append(seg)
-
-                finally:
-                    # Clean up temporary file
-                    file_manager.cleanup_file(temp_path)
+                    result = {"segments": []}
+                return TranscriptionColumns.from_result(result)
+
+            # CTranslate2 runs independent windows in parallel; openai-whisper
+            # installs KV-cache hooks on the shared model per call, so its
+            # windows have to run one at a time
+            with self._model_session(model_size):
+                if self.backend == "faster" and WHISPER_WORKERS > 1:
+                    with ThreadPoolExecutor(max_workers=WHISPER_WORKERS) as pool:
+                        window_results = list(pool.map(transcribe_window, spans))
+                else:
+                    window_results = list(map(transcribe_window, spans))
+
+            # Results come back in span order, so offsets stay aligned.
+            # Timestamps are shifted as whole arrays and each segment is
+            # built once, already in place.
+            segments = []
+            confidences = []
+            for (start, _), columns in zip(spans, window_results):
+                segments.extend(
+                    columns.to_segments(
+                        time_offset=start / SAMPLE_RATE, first_id=len(segments)
+                    )
+                )
+                confidences.append(columns.confidence)
 
             # Calculate overall confidence
             confidence_score = (
-                sum(seg.confidence for seg in segments) / len(segments)
-                if segments
-                else 0.0
+                float(np.concatenate(confidences).mean()) if segments else 0.0
             )
 
             result = TranscriptionResult(
@@ -349,14 +773,13 @@ class WhisperTranscriptionService:
             logger.error(f"Error in segmented transcription: {e}")
             raise RuntimeError(f"Segmented transcription failed: {e}")
 
-    def _calculate_confidence_score(self, segments: List[Dict[str, Any]]) -> float:
-        """Calculate overall confidence score from segments"""
-        if not segments:
+    def _calculate_confidence_score(self, logprobs: np.ndarray) -> float:
+        """Calculate overall confidence score from segment log probabilities"""
+        if not len(logprobs):
             return 0.0
 
         # Use average log probability as confidence score
-        total_logprob = sum(seg.get("avg_logprob", 0.0) for seg in segments)
-        avg_logprob = total_logprob / len(segments)
+        avg_logprob = float(logprobs.mean())
 
         # Convert log probability to confidence score (0-1)
         # Log probabilities are typically negative, so we normalize
@@ -365,13 +788,14 @@ class WhisperTranscriptionService:
 
     def get_supported_languages(self) -> List[str]:
         """Get list of supported languages"""
-        return self.supported_languages.copy()
+        return list(_LANGUAGES)
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the loaded model"""
         return {
             "model_size": self.model_size,
             "device": self.device,
+            "backend": self.backend,
             "loaded": self.model is not None,
             "supported_languages": len(self.supported_languages),
             "available_models": self.model_sizes,
@@ -380,48 +804,156 @@ class WhisperTranscriptionService:
     def detect_language(self, audio_path: str) -> Dict[str, Any]:
         """Detect language from audio file"""
         try:
-            if self.model is None:
-                self.load_model()
+            if self.backend == "faster":
+                with self._model_session():
+                    # Segments are generated lazily, so this only runs detection
+                    _, info = self.model.transcribe(audio_path)
+                top_languages = info.all_language_probs[:5]
+                return {
+                    "detected_language": info.language,
+                    "confidence": info.language_probability,
+                    "top_predictions": top_languages,
+                }
+
+            # Load audio; it is padded or trimmed to 30 s in the reused buffer
+            audio = decode_audio(audio_path)
+
+            with self._model_session(), self._audio_lock, torch.inference_mode():
+                # Make the log-Mel spectrogram on the model device
+                mel = whisper.log_mel_spectrogram(
+                    self._audio_on_device(audio), n_mels=self.model.dims.n_mels
+                )
 
-            # Load audio and detect language
-            audio = whisper.load_audio(audio_path)
-            audio = whisper.pad_or_trim(audio)
+                # Detect language, in float16 on GPU like transcribe's decoding.
+                # The spectrogram itself stays float32: power values overflow
+                # float16's range
+                if self.device.startswith("cuda"):
+                    mel = mel.half()
+                _, probs = self.model.detect_language(mel)
 
-            # Make log-Mel spectrogram and move to device
-            mel = whisper.log_mel_spectrogram(audio).to(self.device)
+            return self._language_result(probs)
 
-            # Detect language
-            _, probs = self.model.detect_language(mel)
+        except Exception as e:
+            logger.error(f"Error detecting language: {e}")
+            raise RuntimeError(f"Language detection failed: {e}")
 
-            # Get top 5 language predictions
-            top_languages = sorted(probs.items(), key=lambda x: x[1], reverse=True)[:5]
+    def detect_languages(
+        self, audio_paths: List[str], batch_size: int = DETECT_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect the language of several audio files, batching the encoder
 
-            return {
-                "detected_language": top_languages[0][0],
-                "confidence": top_languages[0][1],
-                "top_predictions": top_languages,
-            }
+        Args:
+            audio_paths: Paths to the audio files
+            batch_size: Number of files run through the encoder together
+
+        Returns:
+            detect_language results in the order of audio_paths
+        """
+        try:
+            # faster-whisper has no batched detection
+            if self.backend == "faster":
+                return [self.detect_language(path) for path in audio_paths]
+
+            results = []
+            for i in range(0, len(audio_paths), batch_size):
+                batch = [decode_audio(path) for path in audio_paths[i : i + batch_size]]
+
+                with self._model_session(), self._audio_lock, torch.inference_mode():
+                    # Spectrograms are made one file at a time, since
+                    # log_mel_spectrogram normalizes by the maximum of its
+                    # whole input
+                    mel = torch.stack(
+                        [
+                            whisper.log_mel_spectrogram(
+                                self._audio_on_device(audio),
+                                n_mels=self.model.dims.n_mels,
+                            )
+                            for audio in batch
+                        ]
+                    )
+                    if self.device.startswith("cuda"):
+                        mel = mel.half()
+                    _, probs = self.model.detect_language(mel)
+
+                results.extend(self._language_result(p) for p in probs)
+
+            return results
 
         except Exception as e:
-            logger.error(f"Error detecting language: {e}")
+            logger.error(f"Error detecting languages: {e}")
             raise RuntimeError(f"Language detection failed: {e}")
 
+    @staticmethod
+    def _language_result(probs: Dict[str, float]) -> Dict[str, Any]:
+        """Shape language probabilities into a detection result"""
+        # Get top 5 language predictions
+        top_languages = sorted(probs.items(), key=lambda x: x[1], reverse=True)[:5]
+
+        return {
+            "detected_language": top_languages[0][0],
+            "confidence": top_languages[0][1],
+            "top_predictions": top_languages,
+        }
+
+    def _audio_on_device(self, audio: np.ndarray) -> torch.Tensor:
+        """
+        Move audio, padded or trimmed to a 30 s window, to the model device
+
+        The samples are written into a host buffer (pinned on CUDA) and, on
+        CUDA, a device buffer that are both allocated once and reused, in
+        place of whisper.pad_or_trim's fresh array. Call with _audio_lock
+        held.
+
+        Args:
+            audio: 16 kHz mono float32 samples
+
+        Returns:
+            Tensor with N_SAMPLES samples on self.device
+        """
+        on_cuda = self.device.startswith("cuda")
+        if self._audio_host is None:
+            self._audio_host = torch.empty(
+                whisper.audio.N_SAMPLES, dtype=torch.float32, pin_memory=on_cuda
+            )
+            if on_cuda:
+                self._audio_device = torch.empty(
+                    whisper.audio.N_SAMPLES, dtype=torch.float32, device=self.device
+                )
+                self._audio_copied = torch.cuda.Event()
+
+        # Don't overwrite the host buffer while a previous copy may read it
+        if on_cuda:
+            self._audio_copied.synchronize()
+
+        n = min(len(audio), whisper.audio.N_SAMPLES)
+        self._audio_host[:n].copy_(torch.from_numpy(audio[:n]))
+        self._audio_host[n:].zero_()
+        if not on_cuda:
+            return self._audio_host
+
+        self._audio_device.copy_(self._audio_host, non_blocking=True)
+        self._audio_copied.record(torch.cuda.current_stream(self.device))
+        return self._audio_device
+
     def cleanup(self) -> None:
         """Clean up resources"""
-        if self.model is not None:
-            del self.model
-            self.model = None
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-            logger.info("Whisper model cleaned up")
+        self._audio_host = self._audio_device = self._audio_copied = None
+        self._vad = None
+        _decode_cached.cache_clear()
+        with self._model_lock:
+            if self.model is not None:
+                del self.model
+                self.model = None
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                logger.info("Whisper model cleaned up")
 
 
 # Global instance
 whisper_service = WhisperTranscriptionService()
 
-model = whisper.load_model("base")
-
 
 def transcribe(audio_path):
-    result = model.transcribe(audio_path)
-    return result["text"]
+    """Transcribe an audio file with the shared service, returning the text"""
+    return whisper_service.transcribe_audio(audio_path).text
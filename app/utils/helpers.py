@@ -1,13 +1,26 @@
 import os
 import uuid
+import struct
 import tempfile
 import shutil
+import functools
+import time
+import threading
+from collections import OrderedDict
+from enum import Enum
 from pathlib import Path
 from typing import Optional, Union, Dict, Any
 from datetime import datetime
 import logging
 import json
 import hashlib
+from decouple import config
+
+try:
+    import blake3
+    _BLAKE3_AVAILABLE = True
+except ImportError:
+    _BLAKE3_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +29,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Jobs kept in memory before the least recently updated are dropped
+MAX_JOBS = config('MAX_JOBS', default=10000, cast=int)
+
+class FastPath(str, Enum):
+    """Processing shortcut available for an input file"""
+    NONE = "none"
+    WHISPER_READY = "whisper_ready"  # 16kHz mono 16-bit PCM WAV
+
 class FileManager:
     """Utility class for file operations"""
     
@@ -25,14 +46,9 @@ class FileManager:
     
     def create_temp_file(self, suffix: str = "", prefix: str = "temp_") -> str:
         """Create a temporary file and return its path"""
-        temp_file = tempfile.NamedTemporaryFile(
-            delete=False, 
-            suffix=suffix, 
-            prefix=prefix,
-            dir=self.base_dir
-        )
-        temp_file.close()
-        return temp_file.name
+        fd, path = tempfile.mkstemp(suffix=suffix, prefix=prefix, dir=self.base_dir)
+        os.close(fd)
+        return path
     
     def create_unique_filename(self, original_filename: str) -> str:
         """Create a unique filename based on original filename"""
@@ -58,6 +74,25 @@ class FileManager:
             logger.error(f"Error cleaning up file {file_path}: {e}")
             return False
     
+    def quick_probe(self, file_path: Union[str, Path]) -> FastPath:
+        """Sniff the file header to detect audio Whisper can consume as-is"""
+        try:
+            with open(file_path, 'rb') as f:
+                header = f.read(64)
+        except OSError:
+            return FastPath.NONE
+
+        # RIFF/WAVE with the fmt chunk first
+        if len(header) < 36 or header[0:4] != b'RIFF' or header[8:16] != b'WAVEfmt ':
+            return FastPath.NONE
+
+        audio_format, channels, sample_rate = struct.unpack_from('<HHI', header, 20)
+        bits_per_sample = struct.unpack_from('<H', header, 34)[0]
+
+        if audio_format == 1 and channels == 1 and sample_rate == 16000 and bits_per_sample == 16:
+            return FastPath.WHISPER_READY
+        return FastPath.NONE
+    
     def get_file_size(self, file_path: Union[str, Path]) -> int:
         """Get file size in bytes"""
         try:
@@ -71,12 +106,28 @@ class FileManager:
         ext = os.path.splitext(filename)[1].lower()
         return ext in [f".{ext}" if not ext.startswith(".") else ext for ext in allowed_extensions]
 
+@functools.lru_cache(maxsize=512)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Probe a media file, reusing results until the file changes"""
+    import ffmpeg
+    return ffmpeg.probe(path)
+
+def probe_media(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a media file's container metadata with ffprobe, without decoding it"""
+    stat = os.stat(file_path)
+    return _probe_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
 class AudioUtils:
     """Utility class for audio processing"""
     
     @staticmethod
     def get_audio_duration(file_path: str) -> float:
         """Get audio duration in seconds"""
+        try:
+            return float(probe_media(file_path)['format']['duration'])
+        except Exception as e:
+            logger.debug(f"Probing audio duration failed, decoding instead: {e}")
+        
         try:
             from pydub import AudioSegment
             audio = AudioSegment.from_file(file_path)
@@ -117,8 +168,7 @@ class VideoUtils:
     def get_video_info(file_path: str) -> Dict[str, Any]:
         """Get video information"""
         try:
-            import ffmpeg
-            probe = ffmpeg.probe(file_path)
+            probe = probe_media(file_path)
             video_info = next(
                 (stream for stream in probe['streams'] if stream['codec_type'] == 'video'),
                 None
@@ -141,43 +191,59 @@ class VideoUtils:
 class JobManager:
     """Utility class for managing processing jobs"""
     
-    def __init__(self):
-        self.jobs = {}
+    def __init__(self, max_jobs: int = MAX_JOBS):
+        # Ordered by last update, so the stalest job is evicted first
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
     
     def create_job(self, job_type: str = "dubbing") -> str:
         """Create a new job and return job ID"""
         job_id = str(uuid.uuid4())
-        self.jobs[job_id] = {
-            'id': job_id,
-            'type': job_type,
-            'status': 'pending',
-            'progress': 0.0,
-            'current_step': 'initialization',
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
-            'error_message': None
-        }
+        now = time.time()
+        with self._lock:
+            self.jobs[job_id] = {
+                'id': job_id,
+                'type': job_type,
+                'status': 'pending',
+                'progress': 0.0,
+                'current_step': 'initialization',
+                'created_at': now,
+                'updated_at': now,
+                'error_message': None
+            }
+            while len(self.jobs) > self.max_jobs:
+                self.jobs.popitem(last=False)
         return job_id
     
     def update_job(self, job_id: str, **kwargs) -> bool:
         """Update job status"""
-        if job_id not in self.jobs:
-            return False
-        
-        self.jobs[job_id].update(kwargs)
-        self.jobs[job_id]['updated_at'] = datetime.now().isoformat()
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return False
+            
+            job.update(kwargs)
+            job['updated_at'] = time.time()
+            self.jobs.move_to_end(job_id)
         return True
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get job information"""
-        return self.jobs.get(job_id)
+        """Get a snapshot of job information with ISO 8601 timestamps"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            job = dict(job)
+        
+        job['created_at'] = datetime.fromtimestamp(job['created_at']).isoformat()
+        job['updated_at'] = datetime.fromtimestamp(job['updated_at']).isoformat()
+        return job
     
     def delete_job(self, job_id: str) -> bool:
         """Delete a job"""
-        if job_id in self.jobs:
-            del self.jobs[job_id]
-            return True
-        return False
+        with self._lock:
+            return self.jobs.pop(job_id, None) is not None
 
 class ValidationUtils:
     """Utility class for validation"""
@@ -234,8 +300,29 @@ class ErrorHandler:
         logger.info(f"Job {job_id} - {step}: {status}")
 
 def generate_hash(data: str) -> str:
-    """Generate MD5 hash for data"""
-    return hashlib.md5(data.encode()).hexdigest()
+    """Generate BLAKE2b hash for data"""
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+def advise_sequential(fd: int) -> None:
+    """Hint the kernel that a file will be read once, front to back"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def generate_file_hash(file_path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """
+    Generate a 128-bit hash of a file's contents, reading it in chunks
+
+    Uses SIMD BLAKE3 when the blake3 package is installed, BLAKE2b otherwise.
+    """
+    h = blake3.blake3() if _BLAKE3_AVAILABLE else hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        advise_sequential(f.fileno())
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest(16) if _BLAKE3_AVAILABLE else h.hexdigest()
 
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable format"""
@@ -248,13 +335,20 @@ def format_duration(seconds: float) -> str:
     else:
         return f"{minutes:02d}:{seconds:02d}"
 
+# Characters not allowed in filenames, mapped to underscores
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing invalid characters"""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_SANITIZE_TABLE)
 
 # Global instances
 file_manager = FileManager()
-job_manager = JobManager()
\ No newline at end of file
+
+# Keep job state in Redis when configured so it is shared across workers
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    from .job_store import RedisJobStore
+    job_manager = RedisJobStore(REDIS_URL)
+else:
+    job_manager = JobManager()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Redis-backed job store for sharing job state across processes
+"""
+
+import json
+import uuid
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Set fields on an existing job hash and refresh its TTL in one atomic step,
+# so a job deleted concurrently is not recreated half-filled.
+# KEYS[1]: job key; ARGV[1]: TTL in seconds; ARGV[2:]: field, value pairs
+_UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+def _encode(value: Any) -> Any:
+    """JSON encoder for values json can't serialize natively"""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "value"):  # Enums
+        return value.value
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class RedisJobStore:
+    """Job store keeping each job in a Redis hash, with the JobManager API"""
+
+    def __init__(self, url: str, ttl: int = 24 * 3600, prefix: str = "job:"):
+        self._redis = redis.Redis.from_url(url)
+        self._update = self._redis.register_script(_UPDATE_SCRIPT)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}"
+
+    @staticmethod
+    def _encode_fields(fields: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            name: json.dumps(value, default=_encode) for name, value in fields.items()
+        }
+
+    def _write(self, job_id: str, fields: Dict[str, Any]) -> None:
+        key = self._key(job_id)
+        pipe = self._redis.pipeline()
+        pipe.hset(key, mapping=self._encode_fields(fields))
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def create_job(self, job_type: str = "dubbing") -> str:
+        """Create a new job and return job ID"""
+        job_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+        self._write(
+            job_id,
+            {
+                "id": job_id,
+                "type": job_type,
+                "status": "pending",
+                "progress": 0.0,
+                "current_step": "initialization",
+                "created_at": now,
+                "updated_at": now,
+                "error_message": None,
+            },
+        )
+        return job_id
+
+    def update_job(self, job_id: str, **kwargs) -> bool:
+        """Update job status"""
+        kwargs["updated_at"] = datetime.now().isoformat()
+        args = [self.ttl]
+        for name, value in self._encode_fields(kwargs).items():
+            args += (name, value)
+        return bool(self._update(keys=[self._key(job_id)], args=args))
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job information"""
+        fields = self._redis.hgetall(self._key(job_id))
+        if not fields:
+            return None
+        return {name.decode(): json.loads(value) for name, value in fields.items()}
+
+    def delete_job(self, job_id: str) -> bool:
+        """Delete a job"""
+        return self._redis.delete(self._key(job_id)) > 0
@@ -0,0 +1,120 @@
+"""
+Promise memoization for expensive async calls
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMemoizer:
+    """
+    LRU cache of in-flight and completed calls to an async function
+
+    The cache stores the task running the call rather than its result, so
+    concurrent calls with the same key share a single computation. Failed
+    calls are not cached.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        maxsize: int = 256,
+        key: Optional[Callable[..., Hashable]] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Args:
+            fn: Async function to memoize
+            maxsize: Maximum number of cached calls
+            key: Builds the cache key from the call arguments
+                (defaults to the arguments themselves)
+            sizeof: Returns the size in bytes of a result
+            max_bytes: Maximum total size of cached results
+        """
+        self._fn = fn
+        self._key = key or self._default_key
+        self._sizeof = sizeof
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[Hashable, asyncio.Task]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _default_key(*args, **kwargs) -> Hashable:
+        return args, tuple(sorted(kwargs.items()))
+
+    def is_cached(self, *args, **kwargs) -> bool:
+        """Check whether a call with these arguments would reuse a cached task"""
+        return self._key(*args, **kwargs) in self._cache
+
+    async def __call__(self, *args, **kwargs) -> Any:
+        key = self._key(*args, **kwargs)
+        task = self._cache.get(key)
+
+        if task is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fn(*args, **kwargs))
+            self._cache[key] = task
+            task.add_done_callback(lambda t, key=key: self._on_done(key, t))
+            self._evict()
+
+        # Shield so a cancelled caller does not cancel the shared task
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Record the size of a finished call, or drop it if it failed"""
+        if self._cache.get(key) is not task:
+            return
+
+        if task.cancelled() or task.exception() is not None:
+            self._remove(key)
+            return
+
+        if self._sizeof is not None:
+            try:
+                size = self._sizeof(task.result())
+            except Exception as e:
+                logger.warning(f"Could not size cached result: {e}")
+                size = 0
+            self._sizes[key] = size
+            self._total_bytes += size
+            self._evict()
+
+    def _remove(self, key: Hashable) -> None:
+        self._cache.pop(key, None)
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within bounds"""
+        while self._cache and (
+            len(self._cache) > self.maxsize
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+
+    def clear(self) -> None:
+        """Drop all cached calls"""
+        self._cache.clear()
+        self._sizes.clear()
+        self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics"""
+        return {
+            "entries": len(self._cache),
+            "bytes": self._total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,36 @@
+"""
+Concurrent translation of several texts, shared by the pipeline scripts
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Translation requests in flight at once
+TRANSLATE_WORKERS = 4
+
+
+def translate_texts(
+    translate_text, texts, target_language="en", source_language="auto"
+):
+    """
+    Translate several texts with overlapping requests
+
+    googletrans 4.0.0rc1 translates one string per request, so the texts are
+    sent side by side on a thread pool rather than as a list.
+
+    Args:
+        translate_text: Function translating one text, called as
+            translate_text(text, target_language, source_language)
+        texts: Texts to translate
+        target_language: Target language code
+        source_language: Source language code or 'auto'
+
+    Returns:
+        list: translate_text's result for each text, in input order
+    """
+    with ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS) as pool:
+        return list(
+            pool.map(
+                lambda text: translate_text(text, target_language, source_language),
+                texts,
+            )
+        )
@@ -7,15 +7,39 @@ All-in-one script: Video → Audio → Transcription → Translation → Voice C
 import os
 import sys
 import logging
+import threading
 import subprocess
 import tempfile
 
+from voice_latents import get_conditioning_latents
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Voice cloning models to try, in order of preference
+VOICE_CLONING_MODELS = [
+    "tts_models/multilingual/multi-dataset/xtts_v2",
+    "tts_models/en/vctk/vits",
+    "tts_models/en/ljspeech/tacotron2-DDC",
+]
+
+# Whisper model for transcription, loaded once on first use
+WHISPER_MODEL_SIZE = "base"
+_whisper = None
+_whisper_lock = threading.Lock()
+
+# TTS model and its name, loaded once on first use
+_tts = None
+_tts_model_name = None
+_tts_lock = threading.Lock()
+
+# Compile the XTTS GPT decoder with torch.compile when loading it (opt-in:
+# compiling takes tens of seconds, paid once by a warmup at load time)
+XTTS_COMPILE = os.environ.get("POLYVOX_XTTS_COMPILE", "0") == "1"
+
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
@@ -40,12 +64,12 @@ def check_dependencies():
         print("❌ Google Translator - Missing")
 
     try:
-        import whisper
+        import faster_whisper
 
-        print("✅ OpenAI Whisper - Available")
+        print("✅ faster-whisper - Available")
     except ImportError:
-        missing_deps.append("openai-whisper")
-        print("❌ OpenAI Whisper - Missing")
+        missing_deps.append("faster-whisper")
+        print("❌ faster-whisper - Missing")
 
     # Check transformers version
     try:
@@ -91,63 +115,107 @@ def check_dependencies():
     return True
 
 
-def extract_audio_from_video(video_path, output_path="extracted_audio.wav"):
-    """Extract audio from video using FFmpeg"""
+def extract_audio_from_video(video_path):
+    """
+    Extract audio from video using FFmpeg, straight into memory
+
+    Decodes to 16 kHz mono, the rate Whisper expects, and reads the samples
+    from FFmpeg's stdout instead of writing a wav file.
+
+    Returns:
+        float32 numpy array of samples in [-1, 1), or None on failure
+    """
     print(f"\n📹 STEP 1: Extracting audio from video...")
     print(f"   Video: {video_path}")
-    print(f"   Output: {output_path}")
 
     try:
+        import numpy as np
+
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
-        # Use FFmpeg to extract audio
+        # Use FFmpeg to extract audio, using all cores to decode and resample
         cmd = [
             "ffmpeg",
+            "-nostdin",
+            "-threads",
+            "0",
+            "-filter_threads",
+            "0",
             "-i",
             video_path,
+            "-vn",
             "-acodec",
             "pcm_s16le",
             "-ac",
             "1",
             "-ar",
-            "22050",
-            "-y",  # Overwrite output file
-            output_path,
+            "16000",
+            "-f",
+            "s16le",
+            "pipe:1",
         ]
 
         print(f"   Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True)
 
-        if result.returncode == 0 and os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
-            print(f"   ✅ Audio extracted successfully ({file_size} bytes)")
-            return True
+        if result.returncode == 0 and result.stdout:
+            audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+            audio *= 1.0 / 32768.0
+            print(f"   ✅ Audio extracted successfully ({len(audio) / 16000:.1f}s)")
+            return audio
         else:
-            print(f"   ❌ Audio extraction failed: {result.stderr}")
-            return False
+            print(
+                f"   ❌ Audio extraction failed: {result.stderr.decode(errors='replace')}"
+            )
+            return None
 
     except Exception as e:
         print(f"   ❌ Audio extraction error: {e}")
-        return False
+        return None
+
+
+def get_whisper():
+    """
+    Load the Whisper model once per process
+
+    Uses faster-whisper (CTranslate2) with int8 weights, and float16
+    activations when a GPU is available.
+    """
+    global _whisper
+
+    if _whisper is None:
+        with _whisper_lock:
+            if _whisper is None:
+                import ctranslate2
+                from faster_whisper import WhisperModel
+
+                cuda = ctranslate2.get_cuda_device_count() > 0
+                print("   Loading Whisper model...")
+                _whisper = WhisperModel(
+                    WHISPER_MODEL_SIZE,
+                    device="cuda" if cuda else "cpu",
+                    compute_type="int8_float16" if cuda else "int8",
+                )
+    return _whisper
 
 
-def transcribe_audio(audio_path):
-    """Transcribe audio to text using Whisper"""
+def transcribe_audio(audio):
+    """Transcribe audio (a file path or 16 kHz samples) to text using Whisper"""
     print(f"\n🎤 STEP 2: Transcribing audio to text...")
-    print(f"   Audio: {audio_path}")
+    if isinstance(audio, str):
+        print(f"   Audio: {audio}")
 
     try:
-        import whisper
-
-        print("   Loading Whisper model...")
-        model = whisper.load_model("base")
+        model = get_whisper()
 
         print("   Transcribing audio...")
-        result = model.transcribe(audio_path)
+        # Greedy decoding, skipping silence found by the built-in VAD
+        segments, info = model.transcribe(audio, beam_size=1, vad_filter=True)
 
-        text = result["text"].strip()
-        language = result.get("language", "unknown")
+        # Segments are generated lazily as they are decoded
+        text = "".join(segment.text for segment in segments).strip()
+        language = info.language or "unknown"
 
         print(f"   ✅ Transcription completed")
         print(f"   Detected language: {language}")
@@ -207,7 +275,89 @@ def translate_text(text, target_language="en", source_language="auto"):
         }
 
 
-def clone_voice(text, reference_audio, output_path="cloned_speech.wav"):
+def compile_xtts(model):
+    """
+    Compile the XTTS GPT decoder and warm it up
+
+    The GPT2 transformer run once per generated audio token dominates
+    synthesis time. Its KV cache grows by one step per token, so it is
+    compiled with dynamic shapes rather than CUDA graphs, and a short dummy
+    synthesis pays the compile cost here instead of on the first request.
+
+    Args:
+        model: Loaded XTTS model (tts.synthesizer.tts_model)
+    """
+    import torch
+
+    if not hasattr(torch, "compile"):
+        print("   ⚠️ torch.compile needs PyTorch 2.0+, using eager XTTS")
+        return
+
+    gpt_inference = model.gpt.gpt_inference
+    transformer = gpt_inference.transformer
+    try:
+        print("   Compiling XTTS GPT decoder...")
+        gpt_inference.transformer = torch.compile(
+            gpt_inference.transformer, dynamic=True
+        )
+
+        # Dummy speaker: 32 perceiver latents and one speaker embedding
+        device = next(model.parameters()).device
+        gpt_cond_latent = torch.zeros(
+            1, 32, model.args.gpt_n_model_channels, device=device
+        )
+        speaker_embedding = torch.zeros(1, model.args.d_vector_dim, 1, device=device)
+        with torch.inference_mode():
+            model.inference(
+                "Warming up the voice model.",
+                "en",
+                gpt_cond_latent,
+                speaker_embedding,
+            )
+        print("   ✅ XTTS GPT decoder compiled")
+    except Exception as e:
+        gpt_inference.transformer = transformer
+        print(f"   ⚠️ Could not compile XTTS, using eager: {e}")
+
+
+def get_tts():
+    """
+    Load the first TTS model that works, once per process
+
+    Returns:
+        Tuple of (TTS instance, model name)
+    """
+    global _tts, _tts_model_name
+
+    if _tts is None:
+        with _tts_lock:
+            if _tts is None:
+                import torch
+                from TTS.api import TTS
+
+                gpu = torch.cuda.is_available()
+                print(f"   Loading TTS model on {'GPU' if gpu else 'CPU'}...")
+                for model_name in VOICE_CLONING_MODELS:
+                    try:
+                        print(f"   Trying model: {model_name}")
+                        tts = TTS(model_name=model_name, progress_bar=True, gpu=gpu)
+                        print(f"   ✅ Successfully loaded: {model_name}")
+                        if XTTS_COMPILE and "xtts_v2" in model_name:
+                            compile_xtts(tts.synthesizer.tts_model)
+                        _tts_model_name = model_name
+                        _tts = tts
+                        break
+                    except Exception as model_error:
+                        print(f"   ❌ Model {model_name} failed: {model_error}")
+                        continue
+
+                if _tts is None:
+                    raise RuntimeError("No compatible TTS model could be loaded")
+
+    return _tts, _tts_model_name
+
+
+def clone_voice(text, reference_audio, output_path="cloned_speech.wav", language="en"):
     """Clone voice using TTS"""
     print(f"\n🗣️ STEP 4: Voice cloning...")
     print(f"   Text: {text}")
@@ -215,48 +365,43 @@ def clone_voice(text, reference_audio, output_path="cloned_speech.wav"):
     print(f"   Output: {output_path}")
 
     try:
-        from TTS.api import TTS
-
         if not os.path.exists(reference_audio):
             raise FileNotFoundError(f"Reference audio not found: {reference_audio}")
 
-        print("   Loading TTS model...")
-
-        # Try voice cloning models that actually work
-        voice_cloning_models = [
-            "tts_models/multilingual/multi-dataset/xtts_v2",
-            "tts_models/en/vctk/vits",
-            "tts_models/en/ljspeech/tacotron2-DDC",
-        ]
-
-        tts = None
-        successful_model = None
-
-        for model_name in voice_cloning_models:
-            try:
-                print(f"   Trying model: {model_name}")
-                tts = TTS(model_name=model_name, progress_bar=True, gpu=False)
-                successful_model = model_name
-                print(f"   ✅ Successfully loaded: {model_name}")
-                break
-            except Exception as model_error:
-                print(f"   ❌ Model {model_name} failed: {model_error}")
-                continue
-
-        if tts is None:
-            raise RuntimeError("No compatible TTS model could be loaded")
+        tts, successful_model = get_tts()
 
         print("   Generating cloned speech...")
 
         # Use different methods based on the model
         if "xtts_v2" in successful_model:
-            # XTTS v2 supports voice cloning
-            tts.tts_to_file(
-                text=text,
-                speaker_wav=reference_audio,
-                file_path=output_path,
-                language="en",
+            import soundfile as sf
+
+            # XTTS v2 supports voice cloning; condition on cached speaker
+            # latents instead of re-encoding the reference every call
+            model = tts.synthesizer.tts_model
+            gpt_cond_latent, speaker_embedding = get_conditioning_latents(
+                model, reference_audio
             )
+            chunks = model.inference_stream(
+                text,
+                language,
+                gpt_cond_latent,
+                speaker_embedding,
+                stream_chunk_size=20,
+                overlap_wav_len=1024,
+                enable_text_splitting=True,
+            )
+            # Write chunks as they are decoded (XTTS cross-fades the joins)
+            # rather than holding the whole waveform in memory
+            with sf.SoundFile(
+                output_path,
+                mode="w",
+                samplerate=tts.synthesizer.output_sample_rate,
+                channels=1,
+                subtype="PCM_16",
+            ) as f:
+                for chunk in chunks:
+                    f.write(chunk.squeeze().cpu().numpy())
         elif "vits" in successful_model:
             # VITS model - try with speaker_wav
             try:
@@ -310,12 +455,12 @@ def complete_pipeline(
         return False
 
     # Step 1: Extract audio
-    extracted_audio = "temp_extracted_audio.wav"
-    if not extract_audio_from_video(video_path, extracted_audio):
+    audio = extract_audio_from_video(video_path)
+    if audio is None:
         return False
 
     # Step 2: Transcribe
-    transcription = transcribe_audio(extracted_audio)
+    transcription = transcribe_audio(audio)
     if not transcription["success"]:
         return False
 
@@ -331,12 +476,7 @@ def complete_pipeline(
         final_text = translation["translated"]
 
     # Step 4: Clone voice
-    cloning = clone_voice(final_text, reference_audio, output_name)
-
-    # Clean up temporary file
-    if os.path.exists(extracted_audio):
-        os.remove(extracted_audio)
-        print(f"🧹 Cleaned up temporary file: {extracted_audio}")
+    cloning = clone_voice(final_text, reference_audio, output_name, target_language)
 
     if cloning["success"]:
         print(f"\n🎉 PIPELINE COMPLETED SUCCESSFULLY!")
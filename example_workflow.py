@@ -8,6 +8,7 @@ Video MP4 input → Audio extraction → Transcription → Translation → TTS+V
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), "app"))
@@ -72,8 +73,25 @@ def main():
                 print(f"      Error: {step_result['error']}")
 
 
-def example_batch_processing():
-    """Example of batch processing multiple videos"""
+def _process_video(video_path, reference_audio, target_lang, output_path):
+    """Run the workflow for one video in a worker process"""
+    result = complete_video_to_voice_workflow(
+        video_path=video_path,
+        reference_audio_path=reference_audio,
+        target_language=target_lang,
+        output_path=output_path,
+    )
+    return result["success"], result.get("error")
+
+
+def example_batch_processing(max_workers=2):
+    """
+    Example of batch processing multiple videos
+
+    Videos are processed in parallel worker processes. Each worker loads
+    its own Whisper and TTS models, so raise max_workers only as far as
+    memory (and GPU memory) allows.
+    """
 
     print("\nExample 2: Batch processing multiple videos")
     print("=" * 50)
@@ -86,12 +104,13 @@ def example_batch_processing():
 
     reference_audio = "reference_audio.wav"
 
+    jobs = []
     for i, video_config in enumerate(videos):
         video_path = video_config["path"]
         target_lang = video_config["target_lang"]
         output_path = f"outputs/batch_output_{i+1}_{target_lang}.wav"
 
-        print(f"\nProcessing {video_path} → {target_lang}")
+        print(f"\nQueueing {video_path} → {target_lang}")
 
         if not os.path.exists(video_path):
             print(f"   ⚠️ Skipping: Video not found - {video_path}")
@@ -99,18 +118,20 @@ def example_batch_processing():
 
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        jobs.append((video_path, reference_audio, target_lang, output_path))
+
+    if not jobs:
+        return
+
+    workers = min(len(jobs), max_workers, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_process_video, *zip(*jobs))
 
-        result = complete_video_to_voice_workflow(
-            video_path=video_path,
-            reference_audio_path=reference_audio,
-            target_language=target_lang,
-            output_path=output_path,
-        )
-
-        if result["success"]:
-            print(f"   ✅ Success: {output_path}")
-        else:
-            print(f"   ❌ Failed: {result['error']}")
+        for (video_path, _, _, output_path), (success, error) in zip(jobs, results):
+            if success:
+                print(f"   ✅ {video_path}: {output_path}")
+            else:
+                print(f"   ❌ {video_path} failed: {error}")
 
 
 def example_custom_workflow():
@@ -1,8 +1,13 @@
 import os
 import logging
+import threading
+import torch
 from TTS.api import TTS
 from googletrans import Translator
 
+from batch_translate import translate_texts
+from voice_latents import get_conditioning_latents
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -10,6 +15,42 @@ logger = logging.getLogger(__name__)
 # Initialize translator
 translator = Translator()
 
+# Multilingual XTTS v2, with the much slower English-only Tortoise as fallback
+XTTS_MODEL = "tts_models/multilingual/multi-dataset/xtts_v2"
+FALLBACK_MODEL = "tts_models/en/multi-dataset/tortoise-v2"
+
+# TTS model and its name, loaded once on first use
+_tts = None
+_tts_model_name = None
+_tts_lock = threading.Lock()
+
+
+def get_tts():
+    """
+    Load the voice cloning TTS model once per process
+
+    Returns:
+        Tuple of (TTS instance, model name)
+    """
+    global _tts, _tts_model_name
+
+    if _tts is None:
+        with _tts_lock:
+            if _tts is None:
+                gpu = torch.cuda.is_available()
+                print(
+                    f"[INFO] Loading Coqui TTS model (voice cloning) on {'GPU' if gpu else 'CPU'}..."
+                )
+                try:
+                    tts = TTS(model_name=XTTS_MODEL, progress_bar=True, gpu=gpu)
+                    _tts_model_name = XTTS_MODEL
+                except Exception as e:
+                    logger.warning(f"XTTS failed to load, using Tortoise: {e}")
+                    tts = TTS(model_name=FALLBACK_MODEL, progress_bar=True, gpu=gpu)
+                    _tts_model_name = FALLBACK_MODEL
+                _tts = tts
+    return _tts, _tts_model_name
+
 
 def translate_text(text, target_language="en", source_language="auto"):
     try:
@@ -43,6 +84,7 @@ def synthesize_with_cloned_voice(
     output_path="cloned_speech.wav",
     translate_to=None,
     source_language="auto",
+    translation_result=None,
 ):
     try:
         if not os.path.exists(reference_audio):
@@ -51,25 +93,36 @@ def synthesize_with_cloned_voice(
             print("⚠️ Please provide a valid reference audio file.")
             return {"success": False, "error": error_msg}
         final_text = text
-        translation_result = None
         if translate_to:
-            translation_result = translate_text(text, translate_to, source_language)
+            # Translate here unless the caller already did
+            if translation_result is None:
+                translation_result = translate_text(text, translate_to, source_language)
             if translation_result["success"]:
                 final_text = translation_result["translated"]
             else:
                 print(
                     f"[WARNING] Translation failed: {translation_result['error']}. Using original text."
                 )
-        print("[INFO] Loading Coqui TTS model (voice cloning)...")
-        tts = TTS(
-            model_name="tts_models/en/multi-dataset/tortoise-v2",
-            progress_bar=True,
-            gpu=False,
-        )
+        tts, model_name = get_tts()
         print("[INFO] Generating cloned speech...")
-        tts.tts_to_file(
-            text=final_text, speaker_wav=reference_audio, file_path=output_path
-        )
+        if model_name == XTTS_MODEL:
+            # Speak the target language, conditioning on cached speaker latents
+            model = tts.synthesizer.tts_model
+            gpt_cond_latent, speaker_embedding = get_conditioning_latents(
+                model, reference_audio
+            )
+            out = model.inference(
+                final_text,
+                translate_to or "en",
+                gpt_cond_latent,
+                speaker_embedding,
+                enable_text_splitting=True,
+            )
+            tts.synthesizer.save_wav(out["wav"], output_path)
+        else:
+            tts.tts_to_file(
+                text=final_text, speaker_wav=reference_audio, file_path=output_path
+            )
         print(f"[✅] Cloned voice saved at: {output_path}")
         return {
             "success": True,
@@ -92,8 +145,15 @@ def batch_process(
     translate_to=None,
     source_language="auto",
 ):
+    # Translate all texts up front, with the requests overlapping
+    translations = [None] * len(texts)
+    if translate_to:
+        translations = translate_texts(
+            translate_text, texts, translate_to, source_language
+        )
+
     results = []
-    for i, text in enumerate(texts):
+    for i, (text, translation) in enumerate(zip(texts, translations)):
         output_path = f"cloned_speech_{i+1}.wav"
         print(f"\n[INFO] Processing text {i+1}/{len(texts)}: {text}")
         result = synthesize_with_cloned_voice(
@@ -102,6 +162,7 @@ def batch_process(
             output_path=output_path,
             translate_to=translate_to,
             source_language=source_language,
+            translation_result=translation,
         )
         results.append(result)
     return results
@@ -8,6 +8,8 @@ import os
 import logging
 from typing import Optional, Dict, Any, List
 
+from batch_translate import translate_texts
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -112,6 +114,7 @@ def synthesize_with_cloned_voice(
     output_path: str = "cloned_speech.wav",
     translate_to: Optional[str] = None,
     source_language: str = "auto",
+    translation_result: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Synthesize speech with cloned voice, optionally translating text first
@@ -122,6 +125,7 @@ def synthesize_with_cloned_voice(
         output_path: Output file path
         translate_to: Target language code for translation (None for no translation)
         source_language: Source language code
+        translation_result: translate_text result for text, if already translated
 
     Returns:
         dict: Result with success status and details
@@ -143,10 +147,10 @@ def synthesize_with_cloned_voice(
 
         # Translate text if requested
         final_text = text
-        translation_result = None
 
         if translate_to:
-            translation_result = translate_text(text, translate_to, source_language)
+            if translation_result is None:
+                translation_result = translate_text(text, translate_to, source_language)
             if translation_result["success"]:
                 final_text = translation_result["translated"]
             else:
@@ -195,9 +199,16 @@ def batch_process(
     Returns:
         list: List of results for each text
     """
+    # Translate every text before synthesizing any of them
+    translations: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+    if translate_to:
+        translations = translate_texts(
+            translate_text, texts, translate_to, source_language
+        )
+
     results = []
 
-    for i, text in enumerate(texts):
+    for i, (text, translation) in enumerate(zip(texts, translations)):
         output_path = f"cloned_speech_{i+1}.wav"
         print(f"\n[INFO] Processing text {i+1}/{len(texts)}: {text}")
 
@@ -207,6 +218,7 @@ def batch_process(
             output_path=output_path,
             translate_to=translate_to,
             source_language=source_language,
+            translation_result=translation,
         )
 
         results.append(result)
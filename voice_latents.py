@@ -0,0 +1,54 @@
+"""
+XTTS speaker latents cached in memory and on disk, shared by the pipeline scripts
+"""
+
+import os
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# XTTS speaker latents are saved here so later runs skip recomputing them
+VOICE_DIR = "voices"
+
+# XTTS speaker latents per reference file, keyed by (path, mtime, size)
+_LATENT_CACHE = {}
+
+
+def get_conditioning_latents(model, reference_audio):
+    """
+    Get XTTS speaker latents for a reference file, computing them only once
+
+    Latents are kept in memory for this process and saved under VOICE_DIR,
+    and are recomputed when the reference file changes.
+
+    Args:
+        model: Loaded XTTS model (tts.synthesizer.tts_model)
+        reference_audio: Path to the reference audio
+
+    Returns:
+        Tuple of (gpt_cond_latent, speaker_embedding)
+    """
+    import torch
+
+    stat = os.stat(reference_audio)
+    key = (os.path.abspath(reference_audio), stat.st_mtime_ns, stat.st_size)
+    latents = _LATENT_CACHE.get(key)
+    if latents is not None:
+        return latents
+
+    name = os.path.splitext(os.path.basename(reference_audio))[0]
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    cache_path = os.path.join(VOICE_DIR, f"{name}-{digest}.pth")
+
+    if os.path.exists(cache_path):
+        logger.info(f"Using saved speaker latents: {cache_path}")
+        latents = tuple(torch.load(cache_path))
+    else:
+        logger.info("Computing speaker latents...")
+        latents = model.get_conditioning_latents(audio_path=[reference_audio])
+        os.makedirs(VOICE_DIR, exist_ok=True)
+        torch.save(latents, cache_path)
+
+    _LATENT_CACHE[key] = latents
+    return latents